@@ -1,17 +1,15 @@
 """Command Line Interface for TimeTable Generator."""
 
+import functools
+
 import typer
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress
 from rich import print as rprint
 
 from .core.timetable import TimeTable, ScheduleEntry
-from .core.scheduler import Scheduler, SchedulingConstraints
 from .models.subject import Subject, SubjectType, SubjectPriority
 from .models.teacher import Teacher, TeacherType
 from .models.classroom import Classroom, RoomType
@@ -34,17 +32,30 @@ console = Console()
 current_timetable: Optional[TimeTable] = None
 
 
+def _noop(*args, **kwargs) -> None:
+    """Sink for informational output under --quiet."""
+
+
+# Informational output goes through _log so --quiet can disable it without
+# paying Rich markup parsing and per-line flushes; errors keep using rprint
+_log = rprint
+
+
 @app.callback()
 def main_callback(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Suppress informational output"),
     log_file: Optional[str] = typer.Option(None, "--log-file", help="Log file path"),
 ):
     """TimeTable Generator CLI."""
+    global _log
+    _log = _noop if quiet else rprint
+
     log_level = "DEBUG" if verbose else "INFO"
     setup_logging(log_level=log_level, log_file=log_file)
-    
+
     if verbose:
-        rprint("[dim]Verbose mode enabled[/dim]")
+        _log("[dim]Verbose mode enabled[/dim]")
 
 
 @app.command()
@@ -78,33 +89,46 @@ def create(
             end_date=end
         )
         
-        rprint(f"✅ Created timetable: [bold]{name}[/bold]")
-        rprint(f"   Academic Year: {academic_year}")
-        rprint(f"   Semester: {semester}")
-        rprint(f"   Period: {start_date} to {end_date}")
+        _log(f"✅ Created timetable: [bold]{name}[/bold]")
+        _log(f"   Academic Year: {academic_year}")
+        _log(f"   Semester: {semester}")
+        _log(f"   Period: {start_date} to {end_date}")
         
     except Exception as e:
         rprint(f"❌ Error creating timetable: {e}")
         raise typer.Exit(1)
 
 
+@functools.lru_cache(maxsize=8)
+def _load_cached(path: str, mtime_ns: int, size: int, format_type: str) -> Optional[TimeTable]:
+    """Load a timetable, memoized on path identity (mtime + size)."""
+    return load_timetable(path, format_type)
+
+
 @app.command()
-def load(file_path: str = typer.Argument(..., help="Path to timetable file")):
+def load(
+    file_path: str = typer.Argument(..., help="Path to timetable file"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the in-session load cache"),
+):
     """Load a timetable from file."""
     global current_timetable
-    
+
     path = Path(file_path)
     if not path.exists():
         rprint(f"❌ File not found: {file_path}")
         raise typer.Exit(1)
-    
+
     # Determine format from extension
     format_type = path.suffix.lower().replace('.', '') or 'json'
-    
-    current_timetable = load_timetable(path, format_type)
+
+    if no_cache:
+        current_timetable = load_timetable(path, format_type)
+    else:
+        stat = path.stat()
+        current_timetable = _load_cached(str(path), stat.st_mtime_ns, stat.st_size, format_type)
     
     if current_timetable:
-        rprint(f"✅ Loaded timetable: [bold]{current_timetable.name}[/bold]")
+        _log(f"✅ Loaded timetable: [bold]{current_timetable.name}[/bold]")
         _show_timetable_info(current_timetable)
     else:
         rprint(f"❌ Failed to load timetable from {file_path}")
@@ -122,7 +146,7 @@ def save(
         raise typer.Exit(1)
     
     if save_timetable(current_timetable, file_path, format_type):
-        rprint(f"✅ Timetable saved to: {file_path}")
+        _log(f"✅ Timetable saved to: {file_path}")
     else:
         rprint(f"❌ Failed to save timetable to {file_path}")
         raise typer.Exit(1)
@@ -155,7 +179,7 @@ def add_subject(
         )
         
         current_timetable.add_subject(subject)
-        rprint(f"✅ Added subject: [bold]{name}[/bold] ({code})")
+        _log(f"✅ Added subject: [bold]{name}[/bold] ({code})")
         
     except Exception as e:
         rprint(f"❌ Error adding subject: {e}")
@@ -194,7 +218,7 @@ def add_teacher(
         )
         
         current_timetable.add_teacher(teacher)
-        rprint(f"✅ Added teacher: [bold]{name}[/bold] ({employee_id})")
+        _log(f"✅ Added teacher: [bold]{name}[/bold] ({employee_id})")
         
     except Exception as e:
         rprint(f"❌ Error adding teacher: {e}")
@@ -228,7 +252,7 @@ def add_classroom(
         )
         
         current_timetable.add_classroom(classroom)
-        rprint(f"✅ Added classroom: [bold]{name}[/bold] ({room_number}) - Capacity: {capacity}")
+        _log(f"✅ Added classroom: [bold]{name}[/bold] ({room_number}) - Capacity: {capacity}")
         
     except Exception as e:
         rprint(f"❌ Error adding classroom: {e}")
@@ -239,6 +263,8 @@ def add_classroom(
 def generate(
     optimize: bool = typer.Option(True, "--optimize/--no-optimize", help="Optimize the schedule"),
     max_attempts: int = typer.Option(1000, "--max-attempts", help="Maximum scheduling attempts"),
+    backjump: bool = typer.Option(True, "--backjump/--no-backjump", help="Use conflict-directed backjumping"),
+    workers: int = typer.Option(1, "--workers", help="Parallel restart workers for the fallback search"),
 ):
     """Generate a timetable schedule automatically."""
     if not current_timetable:
@@ -258,8 +284,16 @@ def generate(
         raise typer.Exit(1)
     
     try:
-        constraints = SchedulingConstraints()
-        constraints.max_attempts = max_attempts
+        # Imported lazily: the scheduler pulls in the NumPy kernel, which
+        # only the generate command needs
+        from rich.progress import Progress
+        from .core.scheduler import Scheduler, SchedulingConstraints
+
+        constraints = SchedulingConstraints(
+            max_attempts=max_attempts,
+            use_backjumping=backjump,
+            num_workers=workers,
+        )
         
         scheduler = Scheduler(current_timetable, constraints)
         
@@ -271,14 +305,14 @@ def generate(
         
         if success:
             report = scheduler.get_scheduling_report()
-            rprint("✅ Schedule generated successfully!")
-            rprint(f"   Total entries: {report['total_entries']}")
-            rprint(f"   Success rate: {report['success_rate']:.1f}%")
+            _log("✅ Schedule generated successfully!")
+            _log(f"   Total entries: {report['total_entries']}")
+            _log(f"   Success rate: {report['success_rate']:.1f}%")
             
             if report['scheduling_issues']:
                 rprint("⚠️  Issues found:")
                 for issue in report['scheduling_issues'][:5]:  # Show first 5 issues
-                    rprint(f"   • {issue}")
+                    _log(f"   • {issue}")
         else:
             rprint("❌ Failed to generate complete schedule")
             
@@ -316,6 +350,8 @@ def list_subjects():
         rprint("No subjects found.")
         return
     
+    from rich.table import Table
+
     table = Table(title="Subjects")
     table.add_column("Code", style="cyan")
     table.add_column("Name", style="magenta")
@@ -348,6 +384,8 @@ def list_teachers():
         rprint("No teachers found.")
         return
     
+    from rich.table import Table
+
     table = Table(title="Teachers")
     table.add_column("ID", style="cyan")
     table.add_column("Name", style="magenta")
@@ -382,6 +420,8 @@ def list_classrooms():
         rprint("No classrooms found.")
         return
     
+    from rich.table import Table
+
     table = Table(title="Classrooms")
     table.add_column("Room #", style="cyan")
     table.add_column("Name", style="magenta")
@@ -449,7 +489,7 @@ def validate():
     issues = current_timetable.validate_schedule()
     
     if not issues:
-        rprint("✅ No issues found in the timetable!")
+        _log("✅ No issues found in the timetable!")
     else:
         rprint(f"⚠️  Found {len(issues)} issues:")
         for i, issue in enumerate(issues, 1):
@@ -464,7 +504,7 @@ def export_html(file_path: str = typer.Argument(..., help="HTML file path")):
         raise typer.Exit(1)
     
     if export_timetable_html(current_timetable, file_path):
-        rprint(f"✅ Timetable exported to HTML: {file_path}")
+        _log(f"✅ Timetable exported to HTML: {file_path}")
     else:
         rprint(f"❌ Failed to export HTML to {file_path}")
         raise typer.Exit(1)
@@ -479,7 +519,7 @@ def clear():
     
     if typer.confirm("Are you sure you want to clear the schedule?"):
         current_timetable.clear_schedule()
-        rprint("✅ Schedule cleared.")
+        _log("✅ Schedule cleared.")
     else:
         rprint("Operation cancelled.")
 
@@ -496,7 +536,9 @@ def info():
 
 def _show_timetable_info(timetable: TimeTable):
     """Display timetable information."""
-    stats = timetable.get_statistics()
+    from rich.panel import Panel
+
+    stats = timetable.get_quick_stats()
     
     panel_content = f"""
 [bold]Name:[/bold] {timetable.name}
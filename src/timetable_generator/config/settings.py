@@ -1,114 +1,191 @@
 """Configuration settings for the TimeTable Generator."""
 
 import os
-from typing import Dict, List, Optional, Set
-from functools import lru_cache
-
-from pydantic import Field
-try:
-    from pydantic_settings import BaseSettings
-except ImportError:
-    # Fallback for older pydantic versions
-    from pydantic import BaseSettings
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Optional, Set
+from functools import cached_property, lru_cache
 
 from ..models.time_slot import DayOfWeek
 
 
-class Settings(BaseSettings):
-    """Application settings with environment variable support."""
-    
+def _load_env_file(path: str = ".env") -> Dict[str, str]:
+    """Parse simple KEY=VALUE lines from a .env file if present."""
+    values: Dict[str, str] = {}
+    if not os.path.isfile(path):
+        return values
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, _, value = line.partition("=")
+            values[key.strip().upper()] = value.strip().strip('"').strip("'")
+    return values
+
+
+def _env_str(env: Dict[str, str], key: str, default: str) -> str:
+    return env.get(key, default)
+
+
+def _env_opt_str(env: Dict[str, str], key: str) -> Optional[str]:
+    return env.get(key)
+
+
+def _env_int(env: Dict[str, str], key: str, default: int) -> int:
+    raw = env.get(key)
+    return int(raw) if raw is not None else default
+
+
+def _env_bool(env: Dict[str, str], key: str, default: bool) -> bool:
+    raw = env.get(key)
+    if raw is None:
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Application settings with environment variable support.
+
+    A plain frozen dataclass rather than a pydantic BaseSettings: the
+    settings object is built once per process and only read afterwards, so
+    explicit env parsing in :meth:`from_env` buys the same behavior without
+    pydantic's import and validation overhead on CLI cold start.
+    """
+
     # Application settings
-    app_name: str = Field(default="TimeTable Generator", env="APP_NAME")
-    app_version: str = Field(default="0.1.0", env="APP_VERSION")
-    debug: bool = Field(default=False, env="DEBUG")
-    
+    app_name: str = "TimeTable Generator"
+    app_version: str = "0.1.0"
+    debug: bool = False
+
     # Database settings (for future use)
-    database_url: Optional[str] = Field(default=None, env="DATABASE_URL")
-    
+    database_url: Optional[str] = None
+
     # Scheduling settings
-    default_session_duration: int = Field(default=60, env="DEFAULT_SESSION_DURATION")  # minutes
-    working_days: Set[DayOfWeek] = Field(
-        default={DayOfWeek.MONDAY, DayOfWeek.TUESDAY, DayOfWeek.WEDNESDAY, 
-                DayOfWeek.THURSDAY, DayOfWeek.FRIDAY}
-    )
-    daily_start_time: str = Field(default="09:00", env="DAILY_START_TIME")
-    daily_end_time: str = Field(default="17:00", env="DAILY_END_TIME")
-    lunch_break_start: str = Field(default="12:00", env="LUNCH_BREAK_START")
-    lunch_break_end: str = Field(default="13:00", env="LUNCH_BREAK_END")
-    break_duration: int = Field(default=15, env="BREAK_DURATION")  # minutes
-    
+    default_session_duration: int = 60  # minutes
+    working_days: Set[DayOfWeek] = field(default_factory=lambda: {
+        DayOfWeek.MONDAY, DayOfWeek.TUESDAY, DayOfWeek.WEDNESDAY,
+        DayOfWeek.THURSDAY, DayOfWeek.FRIDAY
+    })
+    daily_start_time: str = "09:00"
+    daily_end_time: str = "17:00"
+    lunch_break_start: str = "12:00"
+    lunch_break_end: str = "13:00"
+    break_duration: int = 15  # minutes
+
     # Scheduling constraints
-    max_consecutive_hours: int = Field(default=3, env="MAX_CONSECUTIVE_HOURS")
-    max_daily_hours_per_teacher: int = Field(default=8, env="MAX_DAILY_HOURS_PER_TEACHER")
-    max_weekly_hours_per_teacher: int = Field(default=40, env="MAX_WEEKLY_HOURS_PER_TEACHER")
-    prefer_morning_sessions: bool = Field(default=True, env="PREFER_MORNING_SESSIONS")
-    avoid_single_hour_gaps: bool = Field(default=True, env="AVOID_SINGLE_HOUR_GAPS")
-    
+    max_consecutive_hours: int = 3
+    max_daily_hours_per_teacher: int = 8
+    max_weekly_hours_per_teacher: int = 40
+    prefer_morning_sessions: bool = True
+    avoid_single_hour_gaps: bool = True
+
     # File paths
-    data_directory: str = Field(default="data", env="DATA_DIRECTORY")
-    export_directory: str = Field(default="exports", env="EXPORT_DIRECTORY")
-    template_directory: str = Field(default="templates", env="TEMPLATE_DIRECTORY")
-    
+    data_directory: str = "data"
+    export_directory: str = "exports"
+    template_directory: str = "templates"
+
     # Logging settings
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
-    log_file: Optional[str] = Field(default=None, env="LOG_FILE")
-    log_format: str = Field(
-        default="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        env="LOG_FORMAT"
-    )
-    
+    log_level: str = "INFO"
+    log_file: Optional[str] = None
+    log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
     # Export settings
-    default_export_format: str = Field(default="xlsx", env="DEFAULT_EXPORT_FORMAT")
-    include_metadata_in_export: bool = Field(default=True, env="INCLUDE_METADATA_IN_EXPORT")
-    
+    default_export_format: str = "xlsx"
+    include_metadata_in_export: bool = True
+
     # Validation settings
-    strict_validation: bool = Field(default=True, env="STRICT_VALIDATION")
-    allow_teacher_overload: bool = Field(default=False, env="ALLOW_TEACHER_OVERLOAD")
-    allow_classroom_double_booking: bool = Field(default=False, env="ALLOW_CLASSROOM_DOUBLE_BOOKING")
-    
+    strict_validation: bool = True
+    allow_teacher_overload: bool = False
+    allow_classroom_double_booking: bool = False
+
     # Optimization settings
-    max_scheduling_attempts: int = Field(default=1000, env="MAX_SCHEDULING_ATTEMPTS")
-    optimization_algorithm: str = Field(default="greedy", env="OPTIMIZATION_ALGORITHM")
-    genetic_algorithm_population: int = Field(default=100, env="GA_POPULATION")
-    genetic_algorithm_generations: int = Field(default=50, env="GA_GENERATIONS")
-    
-    class Config:
-        """Pydantic configuration."""
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-        
-    def get_working_hours_per_day(self) -> float:
-        """Calculate working hours per day."""
+    max_scheduling_attempts: int = 1000
+    optimization_algorithm: str = "greedy"
+    genetic_algorithm_population: int = 100
+    genetic_algorithm_generations: int = 50
+
+    @classmethod
+    def from_env(cls) -> 'Settings':
+        """Build settings from os.environ, with .env file values as a base."""
+        env = _load_env_file()
+        env.update(os.environ)
+        return cls(
+            app_name=_env_str(env, "APP_NAME", "TimeTable Generator"),
+            app_version=_env_str(env, "APP_VERSION", "0.1.0"),
+            debug=_env_bool(env, "DEBUG", False),
+            database_url=_env_opt_str(env, "DATABASE_URL"),
+            default_session_duration=_env_int(env, "DEFAULT_SESSION_DURATION", 60),
+            daily_start_time=_env_str(env, "DAILY_START_TIME", "09:00"),
+            daily_end_time=_env_str(env, "DAILY_END_TIME", "17:00"),
+            lunch_break_start=_env_str(env, "LUNCH_BREAK_START", "12:00"),
+            lunch_break_end=_env_str(env, "LUNCH_BREAK_END", "13:00"),
+            break_duration=_env_int(env, "BREAK_DURATION", 15),
+            max_consecutive_hours=_env_int(env, "MAX_CONSECUTIVE_HOURS", 3),
+            max_daily_hours_per_teacher=_env_int(env, "MAX_DAILY_HOURS_PER_TEACHER", 8),
+            max_weekly_hours_per_teacher=_env_int(env, "MAX_WEEKLY_HOURS_PER_TEACHER", 40),
+            prefer_morning_sessions=_env_bool(env, "PREFER_MORNING_SESSIONS", True),
+            avoid_single_hour_gaps=_env_bool(env, "AVOID_SINGLE_HOUR_GAPS", True),
+            data_directory=_env_str(env, "DATA_DIRECTORY", "data"),
+            export_directory=_env_str(env, "EXPORT_DIRECTORY", "exports"),
+            template_directory=_env_str(env, "TEMPLATE_DIRECTORY", "templates"),
+            log_level=_env_str(env, "LOG_LEVEL", "INFO"),
+            log_file=_env_opt_str(env, "LOG_FILE"),
+            log_format=_env_str(
+                env, "LOG_FORMAT",
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            ),
+            default_export_format=_env_str(env, "DEFAULT_EXPORT_FORMAT", "xlsx"),
+            include_metadata_in_export=_env_bool(env, "INCLUDE_METADATA_IN_EXPORT", True),
+            strict_validation=_env_bool(env, "STRICT_VALIDATION", True),
+            allow_teacher_overload=_env_bool(env, "ALLOW_TEACHER_OVERLOAD", False),
+            allow_classroom_double_booking=_env_bool(env, "ALLOW_CLASSROOM_DOUBLE_BOOKING", False),
+            max_scheduling_attempts=_env_int(env, "MAX_SCHEDULING_ATTEMPTS", 1000),
+            optimization_algorithm=_env_str(env, "OPTIMIZATION_ALGORITHM", "greedy"),
+            genetic_algorithm_population=_env_int(env, "GA_POPULATION", 100),
+            genetic_algorithm_generations=_env_int(env, "GA_GENERATIONS", 50),
+        )
+
+    @cached_property
+    def working_hours_per_day(self) -> float:
+        """Working hours per day, computed once per instance."""
         from datetime import time
         start = time.fromisoformat(self.daily_start_time)
         end = time.fromisoformat(self.daily_end_time)
         lunch_start = time.fromisoformat(self.lunch_break_start)
         lunch_end = time.fromisoformat(self.lunch_break_end)
-        
+
         total_minutes = (end.hour - start.hour) * 60 + (end.minute - start.minute)
         lunch_minutes = (lunch_end.hour - lunch_start.hour) * 60 + (lunch_end.minute - lunch_start.minute)
-        
+
         return (total_minutes - lunch_minutes) / 60.0
-    
+
+    @cached_property
+    def total_weekly_slots(self) -> int:
+        """Total available time slots per week, computed once per instance."""
+        slots_per_day = int(self.working_hours_per_day * 60 / self.default_session_duration)
+        return slots_per_day * len(self.working_days)
+
+    def get_working_hours_per_day(self) -> float:
+        """Calculate working hours per day."""
+        return self.working_hours_per_day
+
     def get_total_weekly_slots(self) -> int:
         """Calculate total available time slots per week."""
-        daily_hours = self.get_working_hours_per_day()
-        slots_per_day = int(daily_hours * 60 / self.default_session_duration)
-        return slots_per_day * len(self.working_days)
-    
+        return self.total_weekly_slots
+
     def get_data_file_path(self, filename: str) -> str:
         """Get full path for a data file."""
         return os.path.join(self.data_directory, filename)
-    
+
     def get_export_file_path(self, filename: str) -> str:
         """Get full path for an export file."""
         return os.path.join(self.export_directory, filename)
-    
+
     def get_template_file_path(self, filename: str) -> str:
         """Get full path for a template file."""
         return os.path.join(self.template_directory, filename)
-    
+
     def create_directories(self) -> None:
         """Create necessary directories if they don't exist."""
         directories = [
@@ -116,22 +193,27 @@ class Settings(BaseSettings):
             self.export_directory,
             self.template_directory
         ]
-        
+
         for directory in directories:
             os.makedirs(directory, exist_ok=True)
-    
+
     def to_dict(self) -> Dict:
         """Convert settings to dictionary."""
-        return self.dict()
-    
+        return asdict(self)
+
     def update_from_dict(self, config_dict: Dict) -> None:
-        """Update settings from dictionary."""
+        """Update settings from dictionary (explicit escape hatch)."""
         for key, value in config_dict.items():
             if hasattr(self, key):
-                setattr(self, key, value)
+                # Deliberate bypass of the frozen guard: this is the one
+                # sanctioned mutation path, e.g. for test fixtures
+                object.__setattr__(self, key, value)
+        # Drop memoized derived values so they recompute on next access
+        self.__dict__.pop("working_hours_per_day", None)
+        self.__dict__.pop("total_weekly_slots", None)
 
 
-@lru_cache()
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
\ No newline at end of file
+    """Get the process-wide settings singleton (built on first use)."""
+    return Settings.from_env()
@@ -1,35 +1,154 @@
 """Scheduler class for automatic timetable generation."""
 
+import os
+import pickle
 import random
+import dataclasses
+import concurrent.futures
+from bisect import bisect_right, insort
+from dataclasses import dataclass
 from datetime import time, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple, Set
-from collections import defaultdict
+from collections import defaultdict, deque
+
+import numpy as np
 
 from ..models.time_slot import TimeSlot, DayOfWeek
-from ..models.subject import Subject, SubjectPriority
+from ..models.subject import Subject, SubjectPriority, SubjectType
 from ..models.teacher import Teacher
-from ..models.classroom import Classroom
+from ..models.classroom import Classroom, RoomType
 from .timetable import TimeTable, ScheduleEntry
+from .scheduler_kernel import MAX_PACKED_SLOTS, solve
 from ..exceptions.timetable_exceptions import (
     SchedulingConflictError,
     ResourceNotAvailableError,
     InvalidConfigurationError
 )
+from ..config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+# Shared jitter source for slot scoring; reseeded per restart worker so
+# parallel restarts stay seed-diverse
+_rng = np.random.default_rng()
+
+# Scheduling precedence per subject priority, hoisted so the sort key does
+# not rebuild the mapping on every call
+_PRIORITY_ORDER = {
+    SubjectPriority.CRITICAL: 0,
+    SubjectPriority.HIGH: 1,
+    SubjectPriority.MEDIUM: 2,
+    SubjectPriority.LOW: 3,
+}
+
+# Preferred days for lab sessions, shared by the score masks and the
+# fallback scorer
+_LAB_DAYS = frozenset({DayOfWeek.TUESDAY, DayOfWeek.THURSDAY})
+
+
+def _to_min(t: time) -> int:
+    """Minute-of-day for a time value; interval math stays on plain ints."""
+    return t.hour * 60 + t.minute
+
 
+@lru_cache(maxsize=32)
+def _build_time_slots(start_iso: str, end_iso: str, days: Tuple,
+                      lunch_start: time, lunch_end: time,
+                      slot_minutes: int = 60) -> Tuple[TimeSlot, ...]:
+    """
+    Build the weekly slot grid for one settings combination (cached).
 
+    Schedulers with identical day/time settings share the same tuple, so
+    batch runs and tests creating many Scheduler instances pay for slot
+    construction once per distinct configuration. The sweep runs on
+    minute-of-day integers, which works for any slot duration without
+    time-object arithmetic or midnight-rollover branches.
+    """
+    start = time.fromisoformat(start_iso)
+    end = time.fromisoformat(end_iso)
+    start_min = start.hour * 60 + start.minute
+    end_min = end.hour * 60 + end.minute
+    lunch_start_min = lunch_start.hour * 60 + lunch_start.minute
+    lunch_end_min = lunch_end.hour * 60 + lunch_end.minute
+
+    slots = []
+    for day in days:
+        t = start_min
+
+        while t < end_min:
+            # Skip lunch break
+            if lunch_start_min <= t < lunch_end_min:
+                t = lunch_end_min
+                continue
+
+            slot_end = t + slot_minutes
+            if slot_end <= end_min:
+                # Interned so every run shares one object per distinct slot
+                slots.append(TimeSlot.intern(
+                    day,
+                    time(t // 60, t % 60),
+                    time(slot_end // 60, slot_end % 60),
+                ))
+
+            t = slot_end
+
+    return tuple(slots)
+
+
+@dataclass(frozen=True, slots=True)
 class SchedulingConstraints:
-    """Configuration class for scheduling constraints."""
-    
-    def __init__(self):
-        self.max_attempts: int = 1000
-        self.prefer_morning_sessions: bool = True
-        self.avoid_single_hour_gaps: bool = True
-        self.max_consecutive_hours: int = 3
-        self.lunch_break_start: time = time(12, 0)
-        self.lunch_break_end: time = time(13, 0)
-        self.min_break_between_sessions: int = 0  # minutes
-        self.max_daily_hours_per_subject: int = 4
-        self.prefer_same_classroom_for_subject: bool = True
+    """Immutable configuration for scheduling constraints.
+
+    Frozen so a constraints value can be shared between restart workers and
+    hashed for caching; use ``dataclasses.replace`` to derive variants.
+    """
+
+    max_attempts: int = 1000
+    prefer_morning_sessions: bool = True
+    avoid_single_hour_gaps: bool = True
+    max_consecutive_hours: int = 3
+    lunch_break_start: time = time(12, 0)
+    lunch_break_end: time = time(13, 0)
+    min_break_between_sessions: int = 0  # minutes
+    max_daily_hours_per_subject: int = 4
+    prefer_same_classroom_for_subject: bool = True
+    use_backjumping: bool = True
+    num_workers: int = 1
+
+    def to_tuple(self) -> Tuple[int, int, int, int, int, int]:
+        """Flatten the numeric knobs into a plain int tuple for the kernel."""
+        return (
+            self.max_attempts,
+            int(self.prefer_morning_sessions),
+            int(self.avoid_single_hour_gaps),
+            self.max_consecutive_hours,
+            self.num_workers,
+            int(self.use_backjumping),
+        )
+
+
+class KernelProblem:
+    """Flattened CSP arrays handed to the solve kernel.
+
+    Uses __slots__ so the per-run search state stays compact and attribute
+    access is a fixed offset rather than a dict lookup.
+    """
+
+    __slots__ = ("variables", "cand_offsets", "cand_slots", "cand_teachers",
+                 "cand_rooms", "teachers", "classrooms")
+
+    def __init__(self, variables, cand_offsets, cand_slots, cand_teachers,
+                 cand_rooms, teachers, classrooms):
+        self.variables = variables
+        self.cand_offsets = cand_offsets
+        self.cand_slots = cand_slots
+        self.cand_teachers = cand_teachers
+        self.cand_rooms = cand_rooms
+        self.teachers = teachers
+        self.classrooms = classrooms
 
 
 class Scheduler:
@@ -38,41 +157,186 @@ class Scheduler:
     def __init__(self, timetable: TimeTable, constraints: Optional[SchedulingConstraints] = None):
         self.timetable = timetable
         self.constraints = constraints or SchedulingConstraints()
-        self.available_time_slots: List[TimeSlot] = []
-        self._generate_time_slots()
-    
+        self._available_time_slots: Optional[List[TimeSlot]] = None
+        self._feasible_st: Optional[np.ndarray] = None
+        self._feasible_sr: Optional[np.ndarray] = None
+        self._subject_row: Dict[str, int] = {}
+        self._teachers_by_subject: Dict[str, List[Teacher]] = defaultdict(list)
+        # Sorted (start_min, end_min) interval lists per day and per
+        # (resource, day), kept in sync with the timetable's schedule
+        # version; see _sync_occupancy_index. Sorted order keeps overlap
+        # queries at O(log n) even with mixed slot durations.
+        self._occupied: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._teacher_busy: Dict[Tuple[str, str], List[Tuple[int, int]]] = defaultdict(list)
+        self._room_busy: Dict[Tuple[str, str], List[Tuple[int, int]]] = defaultdict(list)
+        # Week-wide occupancy bitmasks over grid slot positions: conflict
+        # checks collapse to one AND when every entry sits on the grid.
+        # _bits_exact goes False when an off-grid entry appears, and the
+        # interval lists above take over.
+        self._occupied_bits: int = 0
+        self._teacher_bits: Dict[str, int] = defaultdict(int)
+        self._room_bits: Dict[str, int] = defaultdict(int)
+        self._bits_exact: bool = True
+        self._entries_by_day: Dict[str, List[ScheduleEntry]] = defaultdict(list)
+        # Static availability bitmasks per resource; see _ensure_availability_masks
+        self._teacher_avail: Optional[Dict[str, int]] = None
+        self._room_avail: Optional[Dict[str, int]] = None
+        self._indexed_version: int = -1
+
+    @property
+    def available_time_slots(self) -> List[TimeSlot]:
+        """Weekly slot grid, built lazily on first use and then reused."""
+        if self._available_time_slots is None:
+            self._generate_time_slots()
+        return self._available_time_slots
+
+    def _grid_pos(self, slot: TimeSlot) -> Optional[int]:
+        """Grid position of a slot, or None if it lies off the grid."""
+        pos = self._slot_pos.get(id(slot))
+        if pos is not None:
+            return pos
+        # Equal-valued slots from outside the intern pool (e.g. loaded from
+        # a file) still map onto the grid by value
+        return self._slot_key_pos.get((slot.day, slot.start_time, slot.end_time))
+
+    def _sync_occupancy_index(self) -> None:
+        """Rebuild the occupancy index if the schedule changed under us."""
+        version = self.timetable._schedule_version
+        if self._indexed_version == version:
+            return
+        # Make sure the grid (and its position tables) exists first
+        self.available_time_slots
+
+        occupied: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        teacher_busy: Dict[Tuple[str, str], List[Tuple[int, int]]] = defaultdict(list)
+        room_busy: Dict[Tuple[str, str], List[Tuple[int, int]]] = defaultdict(list)
+        occupied_bits = 0
+        teacher_bits: Dict[str, int] = defaultdict(int)
+        room_bits: Dict[str, int] = defaultdict(int)
+        bits_exact = True
+        entries_by_day: Dict[str, List[ScheduleEntry]] = defaultdict(list)
+        for entry in self.timetable.schedule:
+            slot = entry.time_slot
+            entries_by_day[slot.day].append(entry)
+            interval = (_to_min(slot.start_time), _to_min(slot.end_time))
+            occupied[slot.day].append(interval)
+            teacher_busy[(entry.teacher.id, slot.day)].append(interval)
+            room_busy[(entry.classroom.id, slot.day)].append(interval)
+            pos = self._grid_pos(slot)
+            if pos is None:
+                bits_exact = False
+            else:
+                bit = 1 << pos
+                occupied_bits |= bit
+                teacher_bits[entry.teacher.id] |= bit
+                room_bits[entry.classroom.id] |= bit
+        for intervals in (*occupied.values(), *teacher_busy.values(), *room_busy.values()):
+            intervals.sort()
+        self._occupied = occupied
+        self._teacher_busy = teacher_busy
+        self._room_busy = room_busy
+        self._occupied_bits = occupied_bits
+        self._teacher_bits = teacher_bits
+        self._room_bits = room_bits
+        self._bits_exact = bits_exact
+        self._entries_by_day = entries_by_day
+        self._indexed_version = version
+
+    def _index_entry(self, entry: ScheduleEntry) -> None:
+        """Fold a just-added entry into the occupancy index in place."""
+        slot = entry.time_slot
+        interval = (_to_min(slot.start_time), _to_min(slot.end_time))
+        insort(self._occupied[slot.day], interval)
+        insort(self._teacher_busy[(entry.teacher.id, slot.day)], interval)
+        insort(self._room_busy[(entry.classroom.id, slot.day)], interval)
+        pos = self._grid_pos(slot)
+        if pos is None:
+            self._bits_exact = False
+        else:
+            bit = 1 << pos
+            self._occupied_bits |= bit
+            self._teacher_bits[entry.teacher.id] |= bit
+            self._room_bits[entry.classroom.id] |= bit
+        self._entries_by_day[slot.day].append(entry)
+        self._indexed_version = self.timetable._schedule_version
+
+    def _ensure_feasibility_masks(self) -> None:
+        """
+        Precompute the search-state-independent feasibility matrices.
+
+        Teacher qualification and the static room requirements (lab flag,
+        capacity, projector/computer equipment) depend only on the
+        (subject, resource) pair, never on the current partial schedule, so
+        they are evaluated once per run and the hot loops reduce to a
+        boolean array read. Rebuilt at the start of every generate call.
+        """
+        subjects = list(self.timetable.subjects.values())
+        teachers = list(self.timetable.teachers.values())
+        classrooms = list(self.timetable.classrooms.values())
+
+        self._subject_row = {subject.code: i for i, subject in enumerate(subjects)}
+        self._feasible_st = np.zeros((len(subjects), len(teachers)), dtype=bool)
+        self._feasible_sr = np.zeros((len(subjects), len(classrooms)), dtype=bool)
+        self._teachers_by_subject = defaultdict(list)
+
+        for s, subject in enumerate(subjects):
+            subject_index = self.timetable.get_subject_index(subject.code)
+            subject_bit = 1 << subject_index if subject_index is not None else 0
+
+            for t, teacher in enumerate(teachers):
+                if self.timetable.get_qualification_mask(teacher.employee_id) & subject_bit:
+                    self._feasible_st[s, t] = True
+                    self._teachers_by_subject[subject.code].append(teacher)
+
+            requirements = {
+                'has_projector': subject.requires_projector,
+                'has_computers': subject.requires_computer,
+            }
+            for r, classroom in enumerate(classrooms):
+                # Str-enum member compares equally whether room_type was
+                # materialized as the enum or its plain string value
+                if subject.requires_lab and classroom.room_type != RoomType.LABORATORY:
+                    continue
+                if subject.max_students and classroom.capacity < subject.max_students:
+                    continue
+                self._feasible_sr[s, r] = classroom.meets_requirements(requirements)
+
     def _generate_time_slots(self) -> None:
         """Generate available time slots based on timetable settings."""
-        self.available_time_slots = []
-        
-        start_time = time.fromisoformat(self.timetable.daily_start_time)
-        end_time = time.fromisoformat(self.timetable.daily_end_time)
-        
-        for day in self.timetable.working_days:
-            current_time = start_time
-            
-            while current_time < end_time:
-                # Skip lunch break
-                if (self.constraints.lunch_break_start <= current_time < self.constraints.lunch_break_end):
-                    current_time = self.constraints.lunch_break_end
-                    continue
-                
-                # Create time slot (assuming 1-hour slots by default)
-                slot_end = (
-                    time(current_time.hour + 1, current_time.minute)
-                    if current_time.hour < 23
-                    else end_time
-                )
-                
-                if slot_end <= end_time:
-                    time_slot = TimeSlot(
-                        day=day,
-                        start_time=current_time,
-                        end_time=slot_end
-                    )
-                    self.available_time_slots.append(time_slot)
-                
-                current_time = slot_end
+        self._available_time_slots = list(_build_time_slots(
+            self.timetable.daily_start_time,
+            self.timetable.daily_end_time,
+            tuple(self.timetable.working_days),
+            self.constraints.lunch_break_start,
+            self.constraints.lunch_break_end,
+        ))
+        self._build_slot_score_masks()
+
+    def _build_slot_score_masks(self) -> None:
+        """Precompute the per-slot score components that never change."""
+        slots = self.available_time_slots
+        lunch_start = self.constraints.lunch_break_start
+        lunch_end = self.constraints.lunch_break_end
+
+        self._morning_mask = np.array(
+            [slot.start_time.hour < 12 for slot in slots], dtype=bool
+        )
+        self._lunch_mask = np.array(
+            [lunch_start <= slot.start_time < lunch_end or
+             lunch_start < slot.end_time <= lunch_end for slot in slots],
+            dtype=bool,
+        )
+        self._tue_thu_mask = np.array(
+            [slot.day in _LAB_DAYS for slot in slots],
+            dtype=bool,
+        )
+        # Interned slots are shared objects, so identity keys the flag lookup
+        self._slot_pos = {id(slot): i for i, slot in enumerate(slots)}
+        # Value-keyed fallback for equal slots built outside the intern pool
+        self._slot_key_pos = {
+            (slot.day, slot.start_time, slot.end_time): i
+            for i, slot in enumerate(slots)
+        }
     
     def generate_schedule(self, optimize: bool = True) -> bool:
         """
@@ -84,172 +348,654 @@ class Scheduler:
         Returns:
             True if scheduling was successful, False otherwise
         """
-        # Clear existing schedule
+        # Clear existing schedule and refresh the static feasibility masks
         self.timetable.clear_schedule()
-        
+        self._ensure_feasibility_masks()
+
+        # Try the array-based kernel first; fall back to the greedy search
+        # (parallel seeded restarts when configured) otherwise
+        if not self._generate_with_kernel():
+            if not self._generate_parallel_greedy():
+                self._generate_schedule_greedy()
+
+        if optimize:
+            self._optimize_schedule()
+
+        return len(self.timetable.schedule) > 0
+
+    def _generate_with_kernel(self) -> bool:
+        """
+        Solve the full schedule with the bitmask backtracking kernel.
+
+        Returns:
+            True if every required session was placed, False when the
+            problem does not fit the kernel or has no complete assignment
+            (the greedy fallback then takes over).
+        """
+        if not self.available_time_slots:
+            return False
+        if len(self.available_time_slots) > MAX_PACKED_SLOTS:
+            return False
+
+        problem = self._build_kernel_problem()
+        if problem is None:
+            return False
+
+        n_vars = len(problem.variables)
+        out_assign = np.zeros(n_vars, dtype=np.int64)
+        assigned = solve(
+            problem.cand_offsets,
+            problem.cand_slots,
+            problem.cand_teachers,
+            problem.cand_rooms,
+            np.zeros(len(problem.teachers), dtype=np.int64),
+            np.zeros(len(problem.classrooms), dtype=np.int64),
+            np.zeros(1, dtype=np.int64),
+            out_assign,
+            1 if self.constraints.use_backjumping else 0,
+        )
+
+        if assigned < n_vars:
+            return False
+
+        # Write the assignment back into ScheduleEntry objects
+        for var_idx, subject in enumerate(problem.variables):
+            cand_idx = out_assign[var_idx]
+            entry = ScheduleEntry(
+                time_slot=self.available_time_slots[problem.cand_slots[cand_idx]],
+                subject=subject,
+                teacher=problem.teachers[problem.cand_teachers[cand_idx]],
+                classroom=problem.classrooms[problem.cand_rooms[cand_idx]],
+            )
+            try:
+                self.timetable.add_schedule_entry(entry)
+            except (SchedulingConflictError, ResourceNotAvailableError):
+                # The kernel guarantees conflict-freedom; any rejection here
+                # means the model-level validation disagrees, so fall back
+                self.timetable.clear_schedule()
+                return False
+
+        return True
+
+    def _build_kernel_problem(self) -> Optional[KernelProblem]:
+        """
+        Materialize the CSP as flat candidate arrays for the kernel.
+
+        Each required session becomes one variable whose domain is the set of
+        feasible (slot, teacher, classroom) triples ordered by slot score.
+        Domains are pre-pruned with an AC-3 pass before flattening. Returns
+        None when some variable's domain becomes empty.
+        """
+        if self._feasible_st is None:
+            self._ensure_feasibility_masks()
+
+        teachers = list(self.timetable.teachers.values())
+        classrooms = list(self.timetable.classrooms.values())
+
+        variables: List[Subject] = []
+        domain_slots: List[np.ndarray] = []
+        domain_teachers: List[np.ndarray] = []
+        domain_rooms: List[np.ndarray] = []
+        domain_masks: List[np.ndarray] = []
+
+        for subject in self._sort_subjects_by_priority():
+            # Slots ordered best-first so the kernel prefers high-score slots
+            is_lab = subject.subject_type == SubjectType.LAB
+            slot_order = sorted(
+                range(len(self.available_time_slots)),
+                key=lambda i: self._score_time_slot(
+                    self.available_time_slots[i], subject, set(), is_lab
+                ),
+                reverse=True,
+            )
+
+            s_row = self._subject_row[subject.code]
+            feasible_st = self._feasible_st[s_row]
+            feasible_sr = self._feasible_sr[s_row]
+
+            candidates: List[Tuple[int, int, int]] = []
+            for slot_idx in slot_order:
+                slot = self.available_time_slots[slot_idx]
+                for teacher_idx, teacher in enumerate(teachers):
+                    if not (feasible_st[teacher_idx] and teacher.is_available_at(slot)):
+                        continue
+                    for room_idx, classroom in enumerate(classrooms):
+                        if not (feasible_sr[room_idx] and classroom.is_available_at(slot)):
+                            continue
+                        candidates.append((slot_idx, teacher_idx, room_idx))
+
+            if not candidates:
+                return None
+
+            slots_arr = np.array([c[0] for c in candidates], dtype=np.int64)
+            teachers_arr = np.array([c[1] for c in candidates], dtype=np.int64)
+            rooms_arr = np.array([c[2] for c in candidates], dtype=np.int64)
+
+            # Sessions of the same subject share the candidate arrays but
+            # get independent domain masks for the AC-3 pruning
+            for _ in range(subject.sessions_per_week):
+                variables.append(subject)
+                domain_slots.append(slots_arr)
+                domain_teachers.append(teachers_arr)
+                domain_rooms.append(rooms_arr)
+                domain_masks.append(np.ones(len(candidates), dtype=bool))
+
+        if not variables:
+            return None
+
+        if not self._propagate_gac(domain_slots, domain_masks):
+            return None
+
+        # Fail-first (MRV): branch on the most constrained sessions first.
+        # The sort is stable, so ties keep the priority order the variables
+        # were built in.
+        order = sorted(range(len(variables)),
+                       key=lambda v: int(domain_masks[v].sum()))
+        variables = [variables[v] for v in order]
+        domain_slots = [domain_slots[v] for v in order]
+        domain_teachers = [domain_teachers[v] for v in order]
+        domain_rooms = [domain_rooms[v] for v in order]
+        domain_masks = [domain_masks[v] for v in order]
+        self._domains = domain_masks
+
+        # Flatten the pruned domains into SoA arrays with offsets
+        cand_offsets = np.zeros(len(variables) + 1, dtype=np.int64)
+        for i, mask in enumerate(domain_masks):
+            cand_offsets[i + 1] = cand_offsets[i] + int(mask.sum())
+
+        cand_slots = np.concatenate(
+            [slots[mask] for slots, mask in zip(domain_slots, domain_masks)]
+        )
+        cand_teachers = np.concatenate(
+            [arr[mask] for arr, mask in zip(domain_teachers, domain_masks)]
+        )
+        cand_rooms = np.concatenate(
+            [arr[mask] for arr, mask in zip(domain_rooms, domain_masks)]
+        )
+
+        return KernelProblem(variables, cand_offsets, cand_slots,
+                             cand_teachers, cand_rooms, teachers, classrooms)
+
+    def _propagate_gac(self, domain_slots: List[np.ndarray],
+                       domain_masks: List[np.ndarray]) -> bool:
+        """
+        Enforce arc consistency on the pairwise slot-exclusivity constraints.
+
+        Runs an AC-3 queue over all variable pairs: a candidate of variable x
+        loses its support in variable y when y's remaining domain is pinned
+        to that same slot. Prunes domain_masks in place with vectorized
+        boolean operations.
+
+        Returns:
+            False if some domain was wiped out (instance is infeasible).
+        """
+        n_vars = len(domain_slots)
+        queue = deque(
+            (x, y) for x in range(n_vars) for y in range(n_vars) if x != y
+        )
+
+        while queue:
+            x, y = queue.popleft()
+
+            active_y = domain_slots[y][domain_masks[y]]
+            if active_y.size == 0:
+                return False
+
+            # x's values keep support unless y's whole domain sits on one slot
+            unique_slots = np.unique(active_y)
+            if unique_slots.size != 1:
+                continue
+
+            unsupported = domain_masks[x] & (domain_slots[x] == unique_slots[0])
+            if unsupported.any():
+                domain_masks[x] &= ~unsupported
+                if not domain_masks[x].any():
+                    return False
+                queue.extend(
+                    (z, x) for z in range(n_vars) if z != x and z != y
+                )
+
+        return True
+
+    def _generate_parallel_greedy(self) -> bool:
+        """
+        Run seeded greedy restarts in parallel worker processes.
+
+        Restarts are embarrassingly parallel: each worker gets a disjoint
+        seed and an equal share of the attempt budget, and the first worker
+        to place every required session wins (otherwise the best partial
+        result is kept). Returns False when parallelism is not configured,
+        not worth the dispatch cost, or unavailable on this platform.
+        """
+        num_workers = min(self.constraints.num_workers, os.cpu_count() or 1)
+        if num_workers < 2:
+            return False
+        if self.constraints.max_attempts < 4 * num_workers:
+            return False
+
+        required_sessions = sum(
+            subject.sessions_per_week for subject in self.timetable.subjects.values()
+        )
+
+        # Serialize the problem once and hand it to each worker through the
+        # pool initializer; per-task submit payloads are then just two ints
+        # instead of a pickled copy of the whole timetable per task
+        payload = pickle.dumps(
+            (self.timetable, self.constraints), protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+        best: List[ScheduleEntry] = []
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=num_workers,
+                initializer=_init_restart_worker,
+                initargs=(payload,),
+            ) as executor:
+                futures = [
+                    executor.submit(_greedy_restart_worker, num_workers, seed)
+                    for seed in range(num_workers)
+                ]
+                for future in concurrent.futures.as_completed(futures):
+                    result = future.result()
+                    if len(result) > len(best):
+                        best = result
+                    if len(best) >= required_sessions:
+                        for pending in futures:
+                            pending.cancel()
+                        break
+        except (OSError, ValueError):
+            # No usable worker pool on this platform - run serially instead
+            return False
+
+        if not best:
+            return False
+
+        self.timetable.schedule = list(best)
+        self.timetable._invalidate_schedule_caches()
+        return True
+
+    def _generate_schedule_greedy(self) -> None:
+        """Greedy fallback search used when the kernel cannot solve fully."""
         # Sort subjects by priority and requirements
         sorted_subjects = self._sort_subjects_by_priority()
-        
+
+        # Hoist inner-loop constraint reads out of the search
+        max_attempts = self.constraints.max_attempts
+
+        if self._feasible_sr is None:
+            self._ensure_feasibility_masks()
+
         scheduled_subjects = set()
-        
+
         for subject in sorted_subjects:
+            # Skip subjects no resource combination can ever satisfy rather
+            # than burning the whole attempt budget on guaranteed failures
+            if not self._teachers_by_subject.get(subject.code):
+                logger.warning("No qualified teacher for %s; skipping", subject.name)
+                continue
+            if not self._feasible_sr[self._subject_row[subject.code]].any():
+                logger.warning("No suitable classroom for %s; skipping", subject.name)
+                continue
+
             sessions_needed = subject.sessions_per_week
-            sessions_scheduled = 0
-            
-            for _ in range(self.constraints.max_attempts):
-                if sessions_scheduled >= sessions_needed:
-                    break
-                
-                # Find best time slot for this subject
-                best_slot = self._find_best_time_slot(subject, scheduled_subjects)
-                if not best_slot:
-                    continue
-                
-                # Find available teacher
-                teacher = self._find_available_teacher(subject, best_slot)
-                if not teacher:
-                    continue
-                
-                # Find available classroom
-                classroom = self._find_available_classroom(subject, best_slot)
-                if not classroom:
-                    continue
-                
-                # Create schedule entry
-                entry = ScheduleEntry(
-                    time_slot=best_slot,
-                    subject=subject,
-                    teacher=teacher,
-                    classroom=classroom
-                )
-                
-                try:
-                    self.timetable.add_schedule_entry(entry)
-                    sessions_scheduled += 1
-                    scheduled_subjects.add(subject.code)
-                except (SchedulingConflictError, ResourceNotAvailableError):
-                    continue
-            
+
+            # While every entry sits on the slot grid, each session resolves
+            # in one bitmask pass instead of up to max_attempts probes
+            self._sync_occupancy_index()
+            if self._bits_exact:
+                sessions_scheduled = self._schedule_subject_batch(subject)
+            else:
+                sessions_scheduled = self._schedule_subject_attempts(
+                    subject, max_attempts, scheduled_subjects)
+            if sessions_scheduled:
+                scheduled_subjects.add(subject.code)
+
             if sessions_scheduled < sessions_needed:
-                print(f"Warning: Could only schedule {sessions_scheduled}/{sessions_needed} sessions for {subject.name}")
-        
-        if optimize:
-            self._optimize_schedule()
-        
-        return len(self.timetable.schedule) > 0
-    
+                # %-style args defer formatting until WARNING is enabled
+                logger.warning("Could only schedule %d/%d sessions for %s",
+                               sessions_scheduled, sessions_needed, subject.name)
+
+    def _ensure_availability_masks(self) -> None:
+        """Precompute each resource's static availability over the grid.
+
+        Declared availability never changes during a run, so each teacher
+        and classroom gets one bitmask with a bit per grid slot it could in
+        principle take.
+        """
+        if self._teacher_avail is not None:
+            return
+        slots = self.available_time_slots
+        self._teacher_avail = {
+            teacher.id: sum(
+                1 << i for i, slot in enumerate(slots)
+                if teacher.is_available_at(slot)
+            )
+            for teacher in self.timetable.teachers.values()
+        }
+        self._room_avail = {
+            classroom.id: sum(
+                1 << i for i, slot in enumerate(slots)
+                if classroom.is_available_at(slot)
+            )
+            for classroom in self.timetable.classrooms.values()
+        }
+
+    def _schedule_subject_batch(self, subject: Subject) -> int:
+        """Place a subject's sessions by intersecting availability bitmasks.
+
+        Per session the candidate slots are one AND of the free-grid mask
+        with the union of free qualified teachers and free feasible rooms,
+        so there is no retry loop: an empty mask proves no placement exists.
+        """
+        self._ensure_availability_masks()
+        slots = self.available_time_slots
+        full = (1 << len(slots)) - 1
+        teachers = self._teachers_by_subject.get(subject.code, ())
+        feasible_sr = self._feasible_sr[self._subject_row[subject.code]]
+        rooms = [
+            classroom for r, classroom
+            in enumerate(self.timetable.classrooms.values()) if feasible_sr[r]
+        ]
+
+        # Static per-slot score terms for this subject (jitter and the
+        # adjacency bonus are applied per candidate below)
+        base = np.zeros(len(slots))
+        if self.constraints.prefer_morning_sessions:
+            base += 10.0 * self._morning_mask
+        base -= 15.0 * self._lunch_mask
+        if subject.subject_type == SubjectType.LAB:
+            base += 8.0 * self._tue_thu_mask
+
+        placed = 0
+        for _ in range(subject.sessions_per_week):
+            teacher_union = 0
+            for teacher in teachers:
+                teacher_union |= (self._teacher_avail[teacher.id]
+                                  & ~self._teacher_bits.get(teacher.id, 0))
+            room_union = 0
+            for classroom in rooms:
+                room_union |= (self._room_avail[classroom.id]
+                               & ~self._room_bits.get(classroom.id, 0))
+            cands = full & ~self._occupied_bits & teacher_union & room_union
+            if not cands:
+                break
+
+            best_pos = -1
+            best_score = -np.inf
+            mask = cands
+            while mask:
+                bit = mask & -mask
+                pos = bit.bit_length() - 1
+                score = base[pos] + float(_rng.uniform(0.0, 2.0))
+                if self._has_adjacent_occupied(slots[pos]):
+                    score += 5.0
+                if score > best_score:
+                    best_pos, best_score = pos, score
+                mask ^= bit
+
+            bit = 1 << best_pos
+            # cands guarantees at least one free teacher and room on this bit
+            teacher = min(
+                (t for t in teachers
+                 if self._teacher_avail[t.id] & bit
+                 and not self._teacher_bits.get(t.id, 0) & bit),
+                key=lambda t: t.current_weekly_hours,
+            )
+            classroom = min(
+                (c for c in rooms
+                 if self._room_avail[c.id] & bit
+                 and not self._room_bits.get(c.id, 0) & bit),
+                key=lambda c: abs(c.capacity - (subject.max_students or 30)),
+            )
+            entry = ScheduleEntry(
+                time_slot=slots[best_pos],
+                subject=subject,
+                teacher=teacher,
+                classroom=classroom,
+            )
+            try:
+                self.timetable.add_schedule_entry(entry)
+            except (SchedulingConflictError, ResourceNotAvailableError):
+                # Model-level validation disagrees with the masks; stop
+                # rather than retry what the masks claim is free
+                break
+            self._index_entry(entry)
+            placed += 1
+        return placed
+
+    def _schedule_subject_attempts(self, subject: Subject, max_attempts: int,
+                                   scheduled_subjects: Set[str]) -> int:
+        """Probe-based fallback placement for schedules with off-grid slots."""
+        sessions_needed = subject.sessions_per_week
+        sessions_scheduled = 0
+
+        for _ in range(max_attempts):
+            if sessions_scheduled >= sessions_needed:
+                break
+
+            # Find best time slot for this subject
+            best_slot = self._find_best_time_slot(subject, scheduled_subjects)
+            if not best_slot:
+                continue
+
+            # Find available teacher
+            teacher = self._find_available_teacher(subject, best_slot)
+            if not teacher:
+                continue
+
+            # Find available classroom
+            classroom = self._find_available_classroom(subject, best_slot)
+            if not classroom:
+                continue
+
+            # Create schedule entry
+            entry = ScheduleEntry(
+                time_slot=best_slot,
+                subject=subject,
+                teacher=teacher,
+                classroom=classroom
+            )
+
+            try:
+                self.timetable.add_schedule_entry(entry)
+                self._index_entry(entry)
+                sessions_scheduled += 1
+            except (SchedulingConflictError, ResourceNotAvailableError):
+                continue
+
+        return sessions_scheduled
+
     def _sort_subjects_by_priority(self) -> List[Subject]:
         """Sort subjects by scheduling priority."""
-        subjects = list(self.timetable.subjects.values())
-        
-        priority_order = {
-            SubjectPriority.CRITICAL: 0,
-            SubjectPriority.HIGH: 1,
-            SubjectPriority.MEDIUM: 2,
-            SubjectPriority.LOW: 3
-        }
-        
-        return sorted(
-            subjects,
-            key=lambda s: (
-                priority_order.get(s.priority, 4),
+        subjects = self.timetable.subjects.values()
+
+        # Decorate-sort-undecorate: each key tuple is computed exactly once
+        # per subject rather than on every comparison
+        decorated = [
+            (
+                _PRIORITY_ORDER.get(s.priority, 4),
                 -s.sessions_per_week,  # More sessions = higher priority
                 s.requires_lab,  # Lab subjects first
-                s.name
+                s.name,
+                s,
             )
-        )
+            for s in subjects
+        ]
+        decorated.sort(key=lambda item: item[:4])
+        return [item[4] for item in decorated]
     
     def _find_best_time_slot(self, subject: Subject, scheduled_subjects: Set[str]) -> Optional[TimeSlot]:
         """Find the best available time slot for a subject."""
-        available_slots = [
-            slot for slot in self.available_time_slots
-            if self._is_slot_suitable(slot, subject)
-        ]
-        
-        if not available_slots:
+        slots = self.available_time_slots
+        if not slots:
             return None
-        
-        # Score each slot
-        scored_slots = []
-        for slot in available_slots:
-            score = self._score_time_slot(slot, subject, scheduled_subjects)
-            scored_slots.append((slot, score))
-        
-        # Sort by score (higher is better)
-        scored_slots.sort(key=lambda x: x[1], reverse=True)
-        
-        return scored_slots[0][0] if scored_slots else None
+
+        n = len(slots)
+        valid = np.fromiter(
+            (self._is_slot_suitable(slot, subject) for slot in slots),
+            dtype=bool, count=n,
+        )
+        if not valid.any():
+            return None
+
+        # Same scoring terms as _score_time_slot, computed as one vector:
+        # jitter + morning preference - lunch penalty + lab-day bonus
+        # + adjacency bonus, then argmax over the valid slots
+        scores = _rng.uniform(0.0, 2.0, n)
+        if self.constraints.prefer_morning_sessions:
+            scores += 10.0 * self._morning_mask
+        scores -= 15.0 * self._lunch_mask
+        if subject.subject_type == SubjectType.LAB:
+            scores += 8.0 * self._tue_thu_mask
+
+        self._sync_occupancy_index()
+        scores += 5.0 * np.fromiter(
+            (self._has_adjacent_occupied(slot) for slot in slots),
+            dtype=bool, count=n,
+        )
+
+        scores[~valid] = -np.inf
+        return slots[int(scores.argmax())]
+
+    def _has_adjacent_occupied(self, slot: TimeSlot) -> bool:
+        """Check whether an occupied interval touches the slot on its day."""
+        occupied = self._occupied.get(slot.day)
+        if not occupied:
+            return False
+        qs = _to_min(slot.start_time)
+        qe = _to_min(slot.end_time)
+        # Intervals are sorted and non-overlapping, so only the neighbours
+        # around the insertion point can touch the slot
+        i = bisect_right(occupied, (qs, -1))
+        if i and occupied[i - 1][1] == qs:
+            return True
+        return i < len(occupied) and occupied[i][0] == qe
     
     def _is_slot_suitable(self, slot: TimeSlot, subject: Subject) -> bool:
-        """Check if a time slot is suitable for a subject."""
-        # Check if slot duration matches subject duration
-        if slot.duration_minutes != subject.duration_minutes:
-            # For now, accept standard slots and adjust subject duration
-            pass
-        
-        # Check if there are any conflicting entries
-        for entry in self.timetable.schedule:
-            if slot.overlaps_with(entry.time_slot):
-                return False
-        
-        return True
+        """Check if a time slot is suitable for a subject.
+
+        Slot/subject duration mismatches are tolerated: standard slots are
+        accepted and the subject duration is adjusted downstream.
+        """
+        self._sync_occupancy_index()
+
+        # All-on-grid case: occupancy is one AND against the week bitmask
+        if self._bits_exact:
+            pos = self._slot_pos.get(id(slot))
+            if pos is not None:
+                return not (self._occupied_bits >> pos) & 1
+
+        # Mixed/off-grid slots: binary-search the day's sorted intervals
+        return not self._busy_overlap(
+            self._occupied.get(slot.day),
+            _to_min(slot.start_time), _to_min(slot.end_time),
+        )
     
-    def _score_time_slot(self, slot: TimeSlot, subject: Subject, scheduled_subjects: Set[str]) -> float:
-        """Score a time slot for a subject (higher score = better)."""
+    def _score_time_slot(self, slot: TimeSlot, subject: Subject, scheduled_subjects: Set[str],
+                         is_lab: Optional[bool] = None) -> float:
+        """Score a time slot for a subject (higher score = better).
+
+        Callers scoring many slots for one subject pass ``is_lab`` so the
+        enum attribute is read once per subject rather than per slot.
+        """
+        if is_lab is None:
+            is_lab = subject.subject_type == SubjectType.LAB
+        # Grid slots are interned, so the precomputed flags resolve by
+        # identity; slots from outside the grid fall back to comparisons
+        pos = self._slot_pos.get(id(slot)) if self._available_time_slots is not None else None
+        if pos is not None:
+            is_morning = self._morning_mask[pos]
+            overlaps_lunch = self._lunch_mask[pos]
+            is_lab_day = self._tue_thu_mask[pos]
+        else:
+            lunch_start = self.constraints.lunch_break_start
+            lunch_end = self.constraints.lunch_break_end
+            is_morning = slot.start_time.hour < 12
+            overlaps_lunch = (lunch_start <= slot.start_time < lunch_end or
+                              lunch_start < slot.end_time <= lunch_end)
+            is_lab_day = slot.day in _LAB_DAYS
+
         score = 0.0
-        
+
         # Prefer morning sessions if configured
-        if self.constraints.prefer_morning_sessions and slot.start_time.hour < 12:
+        if self.constraints.prefer_morning_sessions and is_morning:
             score += 10.0
-        
+
         # Prefer not to have gaps in the schedule
         adjacent_entries = self._get_adjacent_entries(slot)
         if adjacent_entries:
             score += 5.0
-        
+
         # Avoid scheduling around lunch time
-        if (self.constraints.lunch_break_start <= slot.start_time < self.constraints.lunch_break_end or
-            self.constraints.lunch_break_start < slot.end_time <= self.constraints.lunch_break_end):
+        if overlaps_lunch:
             score -= 15.0
-        
+
         # Prefer certain days for certain subjects (you can customize this)
-        if subject.subject_type.value == "lab" and slot.day in [DayOfWeek.TUESDAY, DayOfWeek.THURSDAY]:
+        if is_lab_day and is_lab:
             score += 8.0
-        
+
         # Add randomness to avoid always picking the same slots
-        score += random.uniform(0, 2)
-        
+        score += float(_rng.uniform(0.0, 2.0))
+
         return score
     
+    @staticmethod
+    def _busy_overlap(busy: Optional[List[Tuple[int, int]]],
+                      start_min: int, end_min: int) -> bool:
+        """Check a sorted, non-overlapping interval list against a query.
+
+        Only the interval straddling the query start and its successor can
+        overlap, so the check is one bisect plus two comparisons.
+        """
+        if not busy:
+            return False
+        i = bisect_right(busy, (start_min, end_min))
+        if i and busy[i - 1][1] > start_min:
+            return True
+        return i < len(busy) and busy[i][0] < end_min
+
     def _get_adjacent_entries(self, slot: TimeSlot) -> List[ScheduleEntry]:
         """Get schedule entries adjacent to the given time slot."""
-        adjacent = []
-        for entry in self.timetable.schedule:
-            if (entry.time_slot.day == slot.day and 
-                entry.time_slot.is_adjacent_to(slot)):
-                adjacent.append(entry)
-        return adjacent
+        # Only same-day entries can be adjacent, so scan one day bucket
+        # instead of the whole schedule
+        self._sync_occupancy_index()
+        return [
+            entry for entry in self._entries_by_day.get(slot.day, ())
+            if entry.time_slot.is_adjacent_to(slot)
+        ]
     
     def _find_available_teacher(self, subject: Subject, time_slot: TimeSlot) -> Optional[Teacher]:
         """Find an available teacher for the subject at the given time slot."""
+        if self._feasible_st is None:
+            self._ensure_feasibility_masks()
+
+        # Only the precomputed qualified subset is ever inspected
         qualified_teachers = [
-            teacher for teacher in self.timetable.teachers.values()
-            if (teacher.can_teach_subject(subject.code) and
-                teacher.is_available_at(time_slot))
+            teacher for teacher in self._teachers_by_subject.get(subject.code, ())
+            if teacher.is_available_at(time_slot)
         ]
         
         if not qualified_teachers:
             return None
         
-        # Check for conflicts with existing schedule
-        available_teachers = []
-        for teacher in qualified_teachers:
-            has_conflict = any(
-                entry.teacher.id == teacher.id and entry.time_slot.overlaps_with(time_slot)
-                for entry in self.timetable.schedule
-            )
-            if not has_conflict:
-                available_teachers.append(teacher)
+        # Check for conflicts against the per-teacher busy index; on-grid
+        # slots use the bitmask, anything else the sorted interval lists
+        self._sync_occupancy_index()
+        pos = self._slot_pos.get(id(time_slot)) if self._bits_exact else None
+        if pos is not None:
+            bit = 1 << pos
+            available_teachers = [
+                teacher for teacher in qualified_teachers
+                if not self._teacher_bits.get(teacher.id, 0) & bit
+            ]
+        else:
+            qs = _to_min(time_slot.start_time)
+            qe = _to_min(time_slot.end_time)
+            available_teachers = [
+                teacher for teacher in qualified_teachers
+                if not self._busy_overlap(
+                    self._teacher_busy.get((teacher.id, time_slot.day)), qs, qe)
+            ]
         
         if not available_teachers:
             return None
@@ -259,36 +1005,38 @@ class Scheduler:
     
     def _find_available_classroom(self, subject: Subject, time_slot: TimeSlot) -> Optional[Classroom]:
         """Find an available classroom for the subject at the given time slot."""
-        # Filter classrooms based on requirements
-        suitable_classrooms = []
-        for classroom in self.timetable.classrooms.values():
-            if not classroom.is_available_at(time_slot):
-                continue
-            
-            # Check subject-specific requirements
-            requirements = {
-                'has_projector': subject.requires_projector,
-                'has_computers': subject.requires_computer,
-            }
-            
-            if subject.requires_lab and classroom.room_type.value != "laboratory":
-                continue
-            
-            if classroom.meets_requirements(requirements):
-                suitable_classrooms.append(classroom)
+        # Static subject/room requirements come from the precomputed mask;
+        # only availability depends on the slot
+        if self._feasible_sr is None:
+            self._ensure_feasibility_masks()
+        feasible_sr = self._feasible_sr[self._subject_row[subject.code]]
+
+        suitable_classrooms = [
+            classroom for r, classroom in enumerate(self.timetable.classrooms.values())
+            if feasible_sr[r] and classroom.is_available_at(time_slot)
+        ]
         
         if not suitable_classrooms:
             return None
         
-        # Check for conflicts with existing schedule
-        available_classrooms = []
-        for classroom in suitable_classrooms:
-            has_conflict = any(
-                entry.classroom.id == classroom.id and entry.time_slot.overlaps_with(time_slot)
-                for entry in self.timetable.schedule
-            )
-            if not has_conflict:
-                available_classrooms.append(classroom)
+        # Check for conflicts against the per-classroom busy index; on-grid
+        # slots use the bitmask, anything else the sorted interval lists
+        self._sync_occupancy_index()
+        pos = self._slot_pos.get(id(time_slot)) if self._bits_exact else None
+        if pos is not None:
+            bit = 1 << pos
+            available_classrooms = [
+                classroom for classroom in suitable_classrooms
+                if not self._room_bits.get(classroom.id, 0) & bit
+            ]
+        else:
+            qs = _to_min(time_slot.start_time)
+            qe = _to_min(time_slot.end_time)
+            available_classrooms = [
+                classroom for classroom in suitable_classrooms
+                if not self._busy_overlap(
+                    self._room_busy.get((classroom.id, time_slot.day)), qs, qe)
+            ]
         
         if not available_classrooms:
             return None
@@ -309,11 +1057,12 @@ class Scheduler:
     
     def _minimize_teacher_gaps(self) -> None:
         """Try to minimize gaps in teacher schedules."""
-        # Group entries by teacher and day
-        teacher_day_entries = defaultdict(lambda: defaultdict(list))
-        
+        # Group entries by (teacher, day) in one flat dict: a single hash
+        # lookup per entry, and no nested-defaultdict lambda to keep alive
+        teacher_day_entries = defaultdict(list)
+
         for entry in self.timetable.schedule:
-            teacher_day_entries[entry.teacher.id][entry.time_slot.day].append(entry)
+            teacher_day_entries[(entry.teacher.id, entry.time_slot.day)].append(entry)
         
         # Look for opportunities to swap time slots to reduce gaps
         # This is a simplified implementation
@@ -368,7 +1117,7 @@ class Scheduler:
                 score = self._score_time_slot(slot, subject, set())
                 suggestions.append((slot, score))
         
-        return sorted(suggestions, key=lambda x: x[1], reverse=True)
+        return sorted(suggestions, key=itemgetter(1), reverse=True)
     
     def get_scheduling_report(self) -> Dict[str, any]:
         """Generate a report on the scheduling process."""
@@ -393,4 +1142,31 @@ class Scheduler:
             return 100.0
         
         actual_sessions = len(self.timetable.schedule)
-        return (actual_sessions / total_required_sessions) * 100.0
\ No newline at end of file
+        return (actual_sessions / total_required_sessions) * 100.0
+
+
+# Per-process problem state installed by the pool initializer
+_worker_state: Dict[str, any] = {}
+
+
+def _init_restart_worker(payload: bytes) -> None:
+    """Deserialize the shared problem once per worker process."""
+    timetable, constraints = pickle.loads(payload)
+    _worker_state["timetable"] = timetable
+    _worker_state["constraints"] = constraints
+
+
+def _greedy_restart_worker(num_workers: int, seed: int) -> List[ScheduleEntry]:
+    """Run one seeded greedy restart on this worker's copy of the problem."""
+    global _rng
+    timetable = _worker_state["timetable"]
+    constraints = _worker_state["constraints"]
+    random.seed(seed)
+    _rng = np.random.default_rng(seed)
+    constraints = dataclasses.replace(
+        constraints, max_attempts=max(1, constraints.max_attempts // num_workers)
+    )
+    scheduler = Scheduler(timetable, constraints)
+    scheduler.timetable.clear_schedule()
+    scheduler._generate_schedule_greedy()
+    return scheduler.timetable.schedule
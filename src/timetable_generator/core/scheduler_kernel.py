@@ -0,0 +1,247 @@
+"""Array-based constraint kernel for the scheduler hot path.
+
+The kernel materializes the timetabling CSP as structure-of-arrays NumPy
+buffers: every required session becomes an integer variable whose domain is a
+flat list of ``(slot, teacher, room)`` candidate triples, and resource
+occupancy is tracked with one integer bitmask per teacher/room (bit i set =
+busy in packed slot i).  The feasibility checks that dominate schedule
+generation then run as C-level integer AND/OR operations instead of Python
+object traversals.
+
+When ``numba`` is installed the solver is JIT-compiled (and warm-compiled at
+import time so the CLI ``generate`` command does not pay the compilation
+latency); otherwise the same function runs as plain Python over the arrays.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is an optional accelerator - the kernel works without it
+    njit = None
+
+# One bitmask word per resource covers the whole week as long as the packed
+# slot index fits in a signed 64-bit integer.
+MAX_PACKED_SLOTS = 63
+
+
+def _maybe_jit(func):
+    """Apply numba JIT compilation when the library is available.
+
+    nogil lets embedding code run the kernels from worker threads (e.g.
+    validating several timetables at once) without serializing on the
+    interpreter lock; the functions only touch their array arguments, so
+    dropping the GIL is safe.
+    """
+    if njit is not None:
+        return njit(nopython=True, cache=True, nogil=True)(func)
+    return func
+
+
+@_maybe_jit
+def solve(cand_offsets, cand_slots, cand_teachers, cand_rooms,
+          teacher_busy, room_busy, slot_busy, out_assign,
+          use_backjumping):
+    """
+    Backtracking search over per-session candidate triples.
+
+    Args:
+        cand_offsets: int64 array of length n_vars + 1; candidates for
+            variable v live in the half-open range [offsets[v], offsets[v+1])
+        cand_slots: packed slot index per candidate
+        cand_teachers: teacher index per candidate
+        cand_rooms: room index per candidate
+        teacher_busy: int64 occupancy bitmask per teacher (mutated)
+        room_busy: int64 occupancy bitmask per room (mutated)
+        slot_busy: length-1 int64 global slot occupancy bitmask (mutated)
+        out_assign: int64 output array; receives the chosen candidate index
+            for each variable on success
+        use_backjumping: when non-zero, use conflict-directed backjumping
+            (Dechter/Frost scheme) instead of chronological backtracking
+
+    Returns:
+        Number of assigned variables: n_vars on success, 0 when no complete
+        assignment exists.
+    """
+    n_vars = out_assign.shape[0]
+    n_slots = MAX_PACKED_SLOTS + 1
+    choice = np.full(n_vars, -1, dtype=np.int64)
+
+    # Conflict bitsets over variables, one 64-bit word per 64 variables;
+    # slot_owner maps an occupied slot back to the variable holding it
+    n_words = (n_vars + 63) // 64
+    conflict_set = np.zeros((n_vars, n_words), dtype=np.uint64)
+    slot_owner = np.full(n_slots, -1, dtype=np.int64)
+
+    var = 0
+    while 0 <= var < n_vars:
+        start = cand_offsets[var]
+        end = cand_offsets[var + 1]
+        placed = False
+
+        idx = start + choice[var] + 1
+        while idx < end:
+            slot = cand_slots[idx]
+            teacher = cand_teachers[idx]
+            room = cand_rooms[idx]
+            bit = np.int64(1) << slot
+
+            if ((slot_busy[0] & bit) == 0 and
+                    (teacher_busy[teacher] & bit) == 0 and
+                    (room_busy[room] & bit) == 0):
+                slot_busy[0] |= bit
+                teacher_busy[teacher] |= bit
+                room_busy[room] |= bit
+                slot_owner[slot] = var
+                choice[var] = idx - start
+                placed = True
+                break
+
+            # Record which earlier variable caused this rejection; under
+            # global slot exclusivity the culprit is the slot's owner
+            culprit = slot_owner[slot]
+            if culprit >= 0:
+                conflict_set[var, culprit >> 6] |= np.uint64(1) << np.uint64(culprit & 63)
+            idx += 1
+
+        if placed:
+            var += 1
+            continue
+
+        if use_backjumping:
+            # Jump to the deepest variable in this variable's conflict set
+            target = np.int64(-1)
+            for w in range(n_words - 1, -1, -1):
+                word = conflict_set[var, w]
+                if word != np.uint64(0):
+                    high = np.int64(-1)
+                    for b in range(63, -1, -1):
+                        if word & (np.uint64(1) << np.uint64(b)):
+                            high = np.int64(b)
+                            break
+                    target = np.int64(w * 64) + high
+                    break
+
+            if target < 0:
+                return 0
+
+            # Absorb the remaining conflicts into the jump target
+            for w in range(n_words):
+                conflict_set[target, w] |= conflict_set[var, w]
+            conflict_set[target, target >> 6] &= ~(np.uint64(1) << np.uint64(target & 63))
+
+            # Unassign every variable from the target up to here
+            for v in range(var, target - 1, -1):
+                if choice[v] >= 0:
+                    prev = cand_offsets[v] + choice[v]
+                    bit = np.int64(1) << cand_slots[prev]
+                    slot_busy[0] &= ~bit
+                    teacher_busy[cand_teachers[prev]] &= ~bit
+                    room_busy[cand_rooms[prev]] &= ~bit
+                    slot_owner[cand_slots[prev]] = -1
+                if v != target:
+                    choice[v] = -1
+                    for w in range(n_words):
+                        conflict_set[v, w] = np.uint64(0)
+            var = target
+        else:
+            # Chronological: undo the previous variable's placement and
+            # retry it with its next candidate
+            choice[var] = -1
+            for w in range(n_words):
+                conflict_set[var, w] = np.uint64(0)
+            var -= 1
+            if var >= 0:
+                prev = cand_offsets[var] + choice[var]
+                bit = np.int64(1) << cand_slots[prev]
+                slot_busy[0] &= ~bit
+                teacher_busy[cand_teachers[prev]] &= ~bit
+                room_busy[cand_rooms[prev]] &= ~bit
+                slot_owner[cand_slots[prev]] = -1
+
+    if var < 0:
+        return 0
+
+    for v in range(n_vars):
+        out_assign[v] = cand_offsets[v] + choice[v]
+    return n_vars
+
+
+@_maybe_jit
+def find_conflict_pairs(resource_idx, day_idx, start_min, end_min, order,
+                        out_i, out_j):
+    """
+    Collect overlapping same-resource same-day entry pairs.
+
+    ``order`` must sort the entries by (resource, day, start); the inner
+    scan then only walks forward while a later entry can still overlap, so
+    the loop is near-linear on conflict-free schedules. That sort step is
+    also why this stays a serial njit function rather than a prange
+    pairwise sweep: the O(n^2) comparison space is pruned away up front,
+    leaving too little work per call for thread fan-out to pay for itself
+    at realistic schedule sizes. Pairs are written
+    into ``out_i``/``out_j`` (smaller index first) up to their capacity and
+    the total pair count is returned - callers retry with larger buffers
+    when the count exceeds capacity. Pure integer branches throughout,
+    which numba compiles to tight native code when available.
+
+    Returns:
+        Number of conflicting pairs found (may exceed buffer capacity).
+    """
+    count = 0
+    cap = out_i.shape[0]
+    n = order.shape[0]
+    for pos in range(n):
+        i = order[pos]
+        for later in range(pos + 1, n):
+            j = order[later]
+            if (resource_idx[j] != resource_idx[i]
+                    or day_idx[j] != day_idx[i]
+                    or start_min[j] >= end_min[i]):
+                break
+            if count < cap:
+                if i < j:
+                    out_i[count] = i
+                    out_j[count] = j
+                else:
+                    out_i[count] = j
+                    out_j[count] = i
+            count += 1
+    return count
+
+
+def warmup() -> None:
+    """
+    Compile the kernel on a trivial one-variable problem.
+
+    With numba's cache=True the machine code is persisted next to the
+    module, so after the first run this is a cheap cache load rather than a
+    full compile - cold CLI starts never pay JIT latency inside the
+    generate progress bar. Safe to call eagerly from embedding code; a
+    no-op cost without numba.
+    """
+    solve(
+        np.array([0, 1], dtype=np.int64),
+        np.zeros(1, dtype=np.int64),
+        np.zeros(1, dtype=np.int64),
+        np.zeros(1, dtype=np.int64),
+        np.zeros(1, dtype=np.int64),
+        np.zeros(1, dtype=np.int64),
+        np.zeros(1, dtype=np.int64),
+        np.zeros(1, dtype=np.int64),
+        1,
+    )
+    find_conflict_pairs(
+        np.zeros(1, dtype=np.int64),
+        np.zeros(1, dtype=np.int64),
+        np.zeros(1, dtype=np.int64),
+        np.ones(1, dtype=np.int64),
+        np.zeros(1, dtype=np.int64),
+        np.zeros(1, dtype=np.int64),
+        np.zeros(1, dtype=np.int64),
+    )
+
+
+if njit is not None:
+    warmup()
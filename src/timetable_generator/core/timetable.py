@@ -1,14 +1,21 @@
 """Core TimeTable class for managing timetable data and operations."""
 
-from datetime import datetime
-from typing import Dict, List, Optional, Set, Tuple
+from bisect import bisect_right, insort
+from dataclasses import dataclass, field
+from datetime import datetime, time
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from collections import defaultdict
+from uuid import uuid4
+
+import numpy as np
+from pydantic import Field, PrivateAttr
 
 from ..models.base import BaseModel
 from ..models.time_slot import TimeSlot, DayOfWeek
 from ..models.subject import Subject
 from ..models.teacher import Teacher
 from ..models.classroom import Classroom
+from .scheduler_kernel import find_conflict_pairs
 from ..exceptions.timetable_exceptions import (
     SchedulingConflictError,
     ResourceNotAvailableError,
@@ -16,27 +23,69 @@ from ..exceptions.timetable_exceptions import (
 )
 
 
-class ScheduleEntry(BaseModel):
-    """Represents a single entry in the timetable."""
-    
+def _to_min(t: time) -> int:
+    """Minute-of-day for a time value."""
+    return t.hour * 60 + t.minute
+
+
+@dataclass(slots=True)
+class ScheduleEntry:
+    """Represents a single entry in the timetable.
+
+    A plain slotted dataclass rather than a pydantic model: the schedule
+    list holds thousands of these and every conflict check and aggregation
+    reads their attributes, so fixed-offset slot access without validator
+    machinery matters. The component models it references stay validated
+    pydantic objects; the entry itself is just the tying record, with the
+    slot interval pre-resolved to minute integers at construction.
+    """
+
     time_slot: TimeSlot
     subject: Subject
     teacher: Teacher
     classroom: Classroom
     student_count: Optional[int] = None
     notes: Optional[str] = None
-    
+    id: str = field(default_factory=lambda: str(uuid4()))
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: Optional[datetime] = None
+    # Interval key cached as integers so conflict checks never touch the
+    # nested time objects
+    day: str = field(init=False, repr=False)
+    start_min: int = field(init=False, repr=False)
+    end_min: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.day = self.time_slot.day
+        self.start_min = _to_min(self.time_slot.start_time)
+        self.end_min = _to_min(self.time_slot.end_time)
+
     def conflicts_with(self, other: 'ScheduleEntry') -> bool:
         """Check if this entry conflicts with another."""
-        if not self.time_slot.overlaps_with(other.time_slot):
-            return False
-        
-        # Check for resource conflicts
         return (
-            self.teacher.id == other.teacher.id or
-            self.classroom.id == other.classroom.id
+            self.day == other.day
+            and self.start_min < other.end_min
+            and other.start_min < self.end_min
+            and (self.teacher is other.teacher
+                 or self.classroom is other.classroom
+                 or self.teacher.id == other.teacher.id
+                 or self.classroom.id == other.classroom.id)
         )
-    
+
+    def dict(self) -> Dict[str, any]:
+        """Serialize to the same shape the pydantic model produced."""
+        return {
+            "id": self.id,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "time_slot": self.time_slot.dict(),
+            "subject": self.subject.dict(),
+            "teacher": self.teacher.dict(),
+            "classroom": self.classroom.dict(),
+            "student_count": self.student_count,
+            "notes": self.notes,
+        }
+
     def __str__(self) -> str:
         return f"{self.time_slot} - {self.subject.name} ({self.teacher.name} in {self.classroom.name})"
 
@@ -51,67 +100,306 @@ class TimeTable(BaseModel):
     end_date: datetime
     
     # Resources
-    subjects: Dict[str, Subject] = {}
-    teachers: Dict[str, Teacher] = {}
-    classrooms: Dict[str, Classroom] = {}
-    
+    subjects: Dict[str, Subject] = Field(default_factory=dict)
+    teachers: Dict[str, Teacher] = Field(default_factory=dict)
+    classrooms: Dict[str, Classroom] = Field(default_factory=dict)
+
     # Schedule data
-    schedule: List[ScheduleEntry] = []
-    
+    schedule: List[ScheduleEntry] = Field(default_factory=list)
+
     # Constraints and settings
-    working_days: Set[DayOfWeek] = {
+    working_days: Set[DayOfWeek] = Field(default_factory=lambda: {
         DayOfWeek.MONDAY, DayOfWeek.TUESDAY, DayOfWeek.WEDNESDAY,
         DayOfWeek.THURSDAY, DayOfWeek.FRIDAY
-    }
+    })
     daily_start_time: str = "09:00"
     daily_end_time: str = "17:00"
     break_duration_minutes: int = 15
     lunch_break_duration_minutes: int = 60
-    
+
+    # Cached qualification bitmasks (bit i = qualified for subject index i),
+    # rebuilt lazily whenever subjects or teachers change
+    _subject_index: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _qual_masks: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _qual_masks_dirty: bool = PrivateAttr(default=True)
+
+    # Cached structure-of-arrays view of the schedule for vectorized
+    # aggregation queries, invalidated on any schedule mutation
+    _soa_cache: Optional[tuple] = PrivateAttr(default=None)
+    _stats_cache: Optional[dict] = PrivateAttr(default=None)
+
+    # Incrementally maintained counters backing get_quick_stats();
+    # None means "unknown, rebuild on next read"
+    _cached_total_minutes: Optional[int] = PrivateAttr(default=None)
+    _cached_conflict_count: Optional[int] = PrivateAttr(default=None)
+
+    # Incremental per-teacher and per-(room, day) minute accumulators for
+    # the polling-friendly aggregation accessors; same None-means-rebuild
+    # protocol as the counters above
+    _teacher_minutes: Optional[Dict[str, int]] = PrivateAttr(default=None)
+    _room_day_minutes: Optional[Dict[Tuple[str, str], int]] = PrivateAttr(default=None)
+
+    # Memoized validate_schedule issue list; dropped on schedule mutation
+    # and on resource changes, since requirements checks read both
+    _validation_cache: Optional[List[str]] = PrivateAttr(default=None)
+
+    # Bumped on every schedule mutation so external indexes (e.g. the
+    # scheduler's occupancy maps) can detect staleness cheaply
+    _schedule_version: int = PrivateAttr(default=0)
+
+    # Per-(resource, day) sorted interval lists backing get_conflicts;
+    # rebuilt lazily when the stored version falls behind _schedule_version
+    _conflict_index: Optional[tuple] = PrivateAttr(default=None)
+    _conflict_index_version: int = PrivateAttr(default=-1)
+
+    # Reverse buckets (teacher/room/subject -> entries) behind the
+    # get_*_schedule accessors, maintained with the same version protocol
+    _entry_buckets: Optional[tuple] = PrivateAttr(default=None)
+    _entry_buckets_version: int = PrivateAttr(default=-1)
+
+    # Ordered teacher/room id lists with reverse position maps, shared by
+    # every array build so indices stay stable between rebuilds; dropped
+    # whenever the resource dicts change
+    _resource_index: Optional[tuple] = PrivateAttr(default=None)
+
+    def _ensure_resource_index(self) -> tuple:
+        """
+        Intern teachers and classrooms as dense integer indices.
+
+        Returns (teacher_ids, teacher_pos, room_ids, room_pos): the ordered
+        id lists and their reverse maps. Hot loops that would otherwise
+        hash employee_id/room_number strings per entry resolve a resource
+        once and carry the small int instead.
+        """
+        if self._resource_index is None:
+            teacher_ids = list(self.teachers)
+            room_ids = list(self.classrooms)
+            self._resource_index = (
+                teacher_ids,
+                {tid: i for i, tid in enumerate(teacher_ids)},
+                room_ids,
+                {rid: i for i, rid in enumerate(room_ids)},
+            )
+        return self._resource_index
+
+    def _entries_soa(self) -> tuple:
+        """
+        Materialize the schedule as parallel int32 arrays (cached).
+
+        Returns:
+            (teacher_ids, room_ids, teacher_idx, room_idx, day_idx,
+             start_min, end_min, duration_min) where the first two are the
+            id lists the index columns point into and day_idx follows
+            DayOfWeek order. end_min is the slot's actual end - conflict
+            detection must use it, since the subject duration backing
+            duration_min may legitimately differ from the slot length.
+        """
+        if self._soa_cache is None:
+            teacher_ids, teacher_pos, room_ids, room_pos = self._ensure_resource_index()
+            day_pos = {day.value: i for i, day in enumerate(DayOfWeek)}
+
+            n = len(self.schedule)
+            teacher_idx = np.zeros(n, dtype=np.int32)
+            room_idx = np.zeros(n, dtype=np.int32)
+            day_idx = np.zeros(n, dtype=np.int32)
+            start_min = np.zeros(n, dtype=np.int32)
+            end_min = np.zeros(n, dtype=np.int32)
+            duration_min = np.zeros(n, dtype=np.int32)
+
+            # Entries typically share the resource objects from the
+            # teachers/classrooms dicts, so memoizing on object identity
+            # resolves each distinct object's string key exactly once
+            teacher_memo: Dict[int, int] = {}
+            room_memo: Dict[int, int] = {}
+            for i, entry in enumerate(self.schedule):
+                key = id(entry.teacher)
+                pos = teacher_memo.get(key)
+                if pos is None:
+                    pos = teacher_memo.setdefault(
+                        key, teacher_pos[entry.teacher.employee_id]
+                    )
+                teacher_idx[i] = pos
+                key = id(entry.classroom)
+                pos = room_memo.get(key)
+                if pos is None:
+                    pos = room_memo.setdefault(
+                        key, room_pos[entry.classroom.room_number]
+                    )
+                room_idx[i] = pos
+                day_idx[i] = day_pos[entry.day]
+                start_min[i] = entry.start_min
+                end_min[i] = entry.end_min
+                duration_min[i] = entry.subject.duration_minutes
+
+            self._soa_cache = (
+                teacher_ids, room_ids, teacher_idx, room_idx,
+                day_idx, start_min, end_min, duration_min
+            )
+        return self._soa_cache
+
+    def _invalidate_schedule_caches(self) -> None:
+        """Drop cached views derived from the schedule list."""
+        self._soa_cache = None
+        self._stats_cache = None
+        self._cached_total_minutes = None
+        self._cached_conflict_count = None
+        self._teacher_minutes = None
+        self._room_day_minutes = None
+        self._validation_cache = None
+        self._schedule_version += 1
+
+    def _rebuild_qualification_masks(self) -> None:
+        """Rebuild the subject index and per-teacher qualification bitmasks."""
+        self._subject_index = {code: i for i, code in enumerate(self.subjects)}
+        self._qual_masks = {}
+        for teacher in self.teachers.values():
+            mask = 0
+            for code in teacher.subjects_qualified:
+                index = self._subject_index.get(code.upper())
+                if index is not None:
+                    mask |= 1 << index
+            self._qual_masks[teacher.employee_id] = mask
+        self._qual_masks_dirty = False
+
+    def get_subject_index(self, subject_code: str) -> Optional[int]:
+        """Get the stable bit index assigned to a subject code."""
+        if self._qual_masks_dirty:
+            self._rebuild_qualification_masks()
+        return self._subject_index.get(subject_code.upper())
+
+    def get_qualification_mask(self, employee_id: str) -> int:
+        """Get a teacher's qualification bitmask over the subject index."""
+        if self._qual_masks_dirty:
+            self._rebuild_qualification_masks()
+        return self._qual_masks.get(employee_id, 0)
+
     def add_subject(self, subject: Subject) -> None:
         """Add a subject to the timetable."""
         if subject.code in self.subjects:
             raise InvalidConfigurationError("subject", f"Subject {subject.code} already exists")
         self.subjects[subject.code] = subject
+        self._qual_masks_dirty = True
+        self._validation_cache = None
     
     def add_teacher(self, teacher: Teacher) -> None:
         """Add a teacher to the timetable."""
         if teacher.employee_id in self.teachers:
             raise InvalidConfigurationError("teacher", f"Teacher {teacher.employee_id} already exists")
         self.teachers[teacher.employee_id] = teacher
+        self._qual_masks_dirty = True
+        self._resource_index = None
+        self._validation_cache = None
     
     def add_classroom(self, classroom: Classroom) -> None:
         """Add a classroom to the timetable."""
         if classroom.room_number in self.classrooms:
             raise InvalidConfigurationError("classroom", f"Classroom {classroom.room_number} already exists")
         self.classrooms[classroom.room_number] = classroom
+        self._resource_index = None
+        self._validation_cache = None
     
+    def add_subjects(self, subjects: List[Subject]) -> None:
+        """Add multiple subjects in one pass."""
+        new_subjects: Dict[str, Subject] = {}
+        for subject in subjects:
+            if subject.code in self.subjects or subject.code in new_subjects:
+                raise InvalidConfigurationError("subject", f"Subject {subject.code} already exists")
+            new_subjects[subject.code] = subject
+        self.subjects.update(new_subjects)
+        self._qual_masks_dirty = True
+        self._validation_cache = None
+
+    def add_teachers(self, teachers: List[Teacher]) -> None:
+        """Add multiple teachers in one pass."""
+        new_teachers: Dict[str, Teacher] = {}
+        for teacher in teachers:
+            if teacher.employee_id in self.teachers or teacher.employee_id in new_teachers:
+                raise InvalidConfigurationError("teacher", f"Teacher {teacher.employee_id} already exists")
+            new_teachers[teacher.employee_id] = teacher
+        self.teachers.update(new_teachers)
+        self._qual_masks_dirty = True
+        self._resource_index = None
+        self._validation_cache = None
+
+    def add_classrooms(self, classrooms: List[Classroom]) -> None:
+        """Add multiple classrooms in one pass."""
+        new_classrooms: Dict[str, Classroom] = {}
+        for classroom in classrooms:
+            if classroom.room_number in self.classrooms or classroom.room_number in new_classrooms:
+                raise InvalidConfigurationError("classroom", f"Classroom {classroom.room_number} already exists")
+            new_classrooms[classroom.room_number] = classroom
+        self.classrooms.update(new_classrooms)
+        self._resource_index = None
+        self._validation_cache = None
+
+    def _ensure_entry_buckets(self) -> tuple:
+        """
+        Build the reverse entry buckets (cached per schedule version).
+
+        Returns (by_teacher, by_room, by_subject, by_day) dicts mapping
+        resource keys (and the day string) to their schedule entries, so
+        per-resource and per-day queries and cascade deletions touch only
+        the affected entries instead of filtering the whole schedule.
+        """
+        if (self._entry_buckets is not None
+                and self._entry_buckets_version == self._schedule_version):
+            return self._entry_buckets
+
+        by_teacher: Dict[str, List[ScheduleEntry]] = defaultdict(list)
+        by_room: Dict[str, List[ScheduleEntry]] = defaultdict(list)
+        by_subject: Dict[str, List[ScheduleEntry]] = defaultdict(list)
+        by_day: Dict[str, List[ScheduleEntry]] = defaultdict(list)
+        for entry in self.schedule:
+            by_teacher[entry.teacher.employee_id].append(entry)
+            by_room[entry.classroom.room_number].append(entry)
+            by_subject[entry.subject.code].append(entry)
+            by_day[entry.day].append(entry)
+
+        self._entry_buckets = (by_teacher, by_room, by_subject, by_day)
+        self._entry_buckets_version = self._schedule_version
+        return self._entry_buckets
+
+    def _drop_entries(self, doomed: List[ScheduleEntry]) -> None:
+        """Remove the given entries from the schedule in one pass."""
+        if not doomed:
+            return
+        doomed_ids = {id(entry) for entry in doomed}
+        self.schedule = [e for e in self.schedule if id(e) not in doomed_ids]
+        self._invalidate_schedule_caches()
+
     def remove_subject(self, subject_code: str) -> None:
         """Remove a subject from the timetable."""
         if subject_code not in self.subjects:
             raise ResourceNotAvailableError("Subject", subject_code)
-        
+
         # Remove related schedule entries
-        self.schedule = [entry for entry in self.schedule if entry.subject.code != subject_code]
+        self._drop_entries(self._ensure_entry_buckets()[2].get(subject_code, []))
         del self.subjects[subject_code]
-    
+        self._qual_masks_dirty = True
+        self._validation_cache = None
+
     def remove_teacher(self, employee_id: str) -> None:
         """Remove a teacher from the timetable."""
         if employee_id not in self.teachers:
             raise ResourceNotAvailableError("Teacher", employee_id)
-        
+
         # Remove related schedule entries
-        self.schedule = [entry for entry in self.schedule if entry.teacher.employee_id != employee_id]
+        self._drop_entries(self._ensure_entry_buckets()[0].get(employee_id, []))
         del self.teachers[employee_id]
-    
+        self._qual_masks_dirty = True
+        self._resource_index = None
+        self._validation_cache = None
+
     def remove_classroom(self, room_number: str) -> None:
         """Remove a classroom from the timetable."""
         if room_number not in self.classrooms:
             raise ResourceNotAvailableError("Classroom", room_number)
-        
+
         # Remove related schedule entries
-        self.schedule = [entry for entry in self.schedule if entry.classroom.room_number != room_number]
+        self._drop_entries(self._ensure_entry_buckets()[1].get(room_number, []))
         del self.classrooms[room_number]
+        self._resource_index = None
+        self._validation_cache = None
     
     def add_schedule_entry(self, entry: ScheduleEntry) -> None:
         """Add a schedule entry to the timetable."""
@@ -152,67 +440,400 @@ class TimeTable(BaseModel):
                 f"Classroom {entry.classroom.name} cannot accommodate {entry.student_count} students"
             )
         
+        # An accepted entry is conflict-free by construction, so the quick
+        # counters move by a known amount and survive the cache flush
+        prev_minutes = self._cached_total_minutes
+        prev_conflicts = self._cached_conflict_count
+        teacher_minutes = self._teacher_minutes
+        room_day_minutes = self._room_day_minutes
+        conflict_index = self._conflict_index
+        index_fresh = self._conflict_index_version == self._schedule_version
+        buckets = self._entry_buckets
+        buckets_fresh = self._entry_buckets_version == self._schedule_version
+
         self.schedule.append(entry)
-    
+        self._invalidate_schedule_caches()
+
+        if buckets is not None and buckets_fresh:
+            by_teacher, by_room, by_subject, by_day = buckets
+            by_teacher[entry.teacher.employee_id].append(entry)
+            by_room[entry.classroom.room_number].append(entry)
+            by_subject[entry.subject.code].append(entry)
+            by_day[entry.day].append(entry)
+            self._entry_buckets_version = self._schedule_version
+
+        if prev_minutes is not None:
+            self._cached_total_minutes = prev_minutes + entry.subject.duration_minutes
+            self._cached_conflict_count = prev_conflicts
+
+        duration = entry.subject.duration_minutes
+        if teacher_minutes is not None:
+            teacher_minutes[entry.teacher.employee_id] = (
+                teacher_minutes.get(entry.teacher.employee_id, 0) + duration
+            )
+            self._teacher_minutes = teacher_minutes
+        if room_day_minutes is not None:
+            key = (entry.classroom.room_number, entry.day)
+            room_day_minutes[key] = room_day_minutes.get(key, 0) + duration
+            self._room_day_minutes = room_day_minutes
+
+        # Appends keep existing positions stable, so a fresh conflict index
+        # absorbs the new entry in place instead of rebuilding
+        if conflict_index is not None and index_fresh:
+            teacher_map, room_map = conflict_index
+            slot = entry.time_slot
+            interval = (_to_min(slot.start_time), _to_min(slot.end_time),
+                        len(self.schedule) - 1)
+            insort(teacher_map[(entry.teacher.id, slot.day)], interval)
+            insort(room_map[(entry.classroom.id, slot.day)], interval)
+            self._conflict_index_version = self._schedule_version
+
     def remove_schedule_entry(self, entry: ScheduleEntry) -> None:
         """Remove a schedule entry from the timetable."""
+        prev_minutes = self._cached_total_minutes
+        prev_conflicts = self._cached_conflict_count
+        teacher_minutes = self._teacher_minutes
+        room_day_minutes = self._room_day_minutes
+        removed = [e for e in self.schedule if e.id == entry.id]
+        removed_minutes = sum(e.subject.duration_minutes for e in removed)
+
         self.schedule = [e for e in self.schedule if e.id != entry.id]
+        self._invalidate_schedule_caches()
+
+        # Only safe to adjust in place while the schedule is conflict-free;
+        # with conflicts present the removed entry's share is unknown
+        if prev_minutes is not None and prev_conflicts == 0:
+            self._cached_total_minutes = prev_minutes - removed_minutes
+            self._cached_conflict_count = 0
+
+        # The per-teacher and per-(room, day) accumulators always move by
+        # exactly the removed entries' minutes, conflicts or not
+        for e in removed:
+            duration = e.subject.duration_minutes
+            if teacher_minutes is not None:
+                teacher_minutes[e.teacher.employee_id] -= duration
+            if room_day_minutes is not None:
+                room_day_minutes[(e.classroom.room_number, e.day)] -= duration
+        if teacher_minutes is not None:
+            self._teacher_minutes = teacher_minutes
+        if room_day_minutes is not None:
+            self._room_day_minutes = room_day_minutes
     
+    def bulk_add_entries(self, entries: List[ScheduleEntry]) -> None:
+        """Add many schedule entries in one validated batch.
+
+        Does the same checks as add_schedule_entry but amortized: resource
+        existence is three set differences over the whole batch, and the
+        conflict scan probes the shared interval index once per entry while
+        threading pending entries through local sorted lists, so inserting
+        m entries costs O(m log(n + m)) instead of m full single-entry
+        passes. The batch is atomic - on any conflict nothing is added.
+        """
+        new_entries = list(entries)
+        if not new_entries:
+            return
+
+        missing = {e.subject.code for e in new_entries} - self.subjects.keys()
+        if missing:
+            raise ResourceNotAvailableError("Subject", ", ".join(sorted(missing)))
+        missing = {e.teacher.employee_id for e in new_entries} - self.teachers.keys()
+        if missing:
+            raise ResourceNotAvailableError("Teacher", ", ".join(sorted(missing)))
+        missing = {e.classroom.room_number for e in new_entries} - self.classrooms.keys()
+        if missing:
+            raise ResourceNotAvailableError("Classroom", ", ".join(sorted(missing)))
+
+        teacher_map, room_map = self._ensure_conflict_index()
+        pending_teacher: Dict[tuple, list] = defaultdict(list)
+        pending_room: Dict[tuple, list] = defaultdict(list)
+        issues: List[str] = []
+
+        for entry in new_entries:
+            if not entry.teacher.is_available_at(entry.time_slot):
+                raise ResourceNotAvailableError(
+                    "Teacher", entry.teacher.employee_id, str(entry.time_slot))
+            if not entry.classroom.is_available_at(entry.time_slot):
+                raise ResourceNotAvailableError(
+                    "Classroom", entry.classroom.room_number, str(entry.time_slot))
+            if not entry.teacher.can_teach_subject(entry.subject.code):
+                raise InvalidConfigurationError(
+                    "teacher_subject",
+                    f"Teacher {entry.teacher.name} is not qualified to teach {entry.subject.name}"
+                )
+            if entry.student_count and not entry.classroom.can_accommodate(entry.student_count):
+                raise InvalidConfigurationError(
+                    "classroom_capacity",
+                    f"Classroom {entry.classroom.name} cannot accommodate {entry.student_count} students"
+                )
+
+            start, end = entry.start_min, entry.end_min
+            for index, pending, key in (
+                (teacher_map, pending_teacher, (entry.teacher.id, entry.day)),
+                (room_map, pending_room, (entry.classroom.id, entry.day)),
+            ):
+                intervals = index.get(key)
+                if intervals:
+                    for pos in self._overlapping_positions(intervals, start, end):
+                        issues.append(
+                            f"{entry} conflicts with {self.schedule[pos]}")
+                # Pending intervals are kept non-overlapping, so only the
+                # bisect neighbours can clash with the new one
+                local = pending[key]
+                i = bisect_right(local, (start, end), key=lambda t: t[:2])
+                if i and local[i - 1][1] > start:
+                    issues.append(f"{entry} conflicts with {local[i - 1][2]}")
+                elif i < len(local) and local[i][0] < end:
+                    issues.append(f"{entry} conflicts with {local[i][2]}")
+                else:
+                    local.insert(i, (start, end, entry))
+
+        if issues:
+            raise SchedulingConflictError(
+                "Batch contains conflicting schedule entries", issues)
+
+        self.schedule.extend(new_entries)
+        self._invalidate_schedule_caches()
+
+    def _ensure_conflict_index(self) -> tuple:
+        """
+        Build the per-resource interval index behind get_conflicts.
+
+        Entries are grouped by (teacher, day) and (classroom, day) into
+        start-sorted (start_min, end_min, position) lists, so a conflict
+        probe is a binary search plus a short neighbour walk instead of a
+        scan over the whole schedule. add_schedule_entry keeps the index
+        current on append; any other mutation bumps the schedule version
+        and triggers a lazy rebuild here.
+        """
+        if (self._conflict_index is not None
+                and self._conflict_index_version == self._schedule_version):
+            return self._conflict_index
+
+        teacher_map: Dict[tuple, list] = defaultdict(list)
+        room_map: Dict[tuple, list] = defaultdict(list)
+        for pos, entry in enumerate(self.schedule):
+            slot = entry.time_slot
+            interval = (_to_min(slot.start_time), _to_min(slot.end_time), pos)
+            teacher_map[(entry.teacher.id, slot.day)].append(interval)
+            room_map[(entry.classroom.id, slot.day)].append(interval)
+        for index in (teacher_map, room_map):
+            for intervals in index.values():
+                intervals.sort()
+
+        self._conflict_index = (teacher_map, room_map)
+        self._conflict_index_version = self._schedule_version
+        return self._conflict_index
+
+    @staticmethod
+    def _overlapping_positions(intervals: list, start_min: int,
+                               end_min: int) -> Iterator[int]:
+        """Yield schedule positions of intervals overlapping [start, end).
+
+        Assumes the list holds non-overlapping intervals sorted by start,
+        which add_schedule_entry guarantees per resource; then only the
+        neighbours around the insertion point can overlap the query.
+        """
+        i = bisect_right(intervals, (start_min, 24 * 60, len(intervals)))
+        k = i - 1
+        while k >= 0 and intervals[k][1] > start_min:
+            yield intervals[k][2]
+            k -= 1
+        k = i
+        while k < len(intervals) and intervals[k][0] < end_min:
+            yield intervals[k][2]
+            k += 1
+
     def get_conflicts(self, entry: ScheduleEntry) -> List[ScheduleEntry]:
         """Get all conflicts for a potential schedule entry."""
-        conflicts = []
-        for existing_entry in self.schedule:
-            if entry.conflicts_with(existing_entry):
-                conflicts.append(existing_entry)
-        return conflicts
+        teacher_map, room_map = self._ensure_conflict_index()
+        slot = entry.time_slot
+        start_min = _to_min(slot.start_time)
+        end_min = _to_min(slot.end_time)
+
+        positions = set()
+        for index, key in (
+            (teacher_map, (entry.teacher.id, slot.day)),
+            (room_map, (entry.classroom.id, slot.day)),
+        ):
+            intervals = index.get(key)
+            if intervals:
+                positions.update(
+                    self._overlapping_positions(intervals, start_min, end_min)
+                )
+        return [self.schedule[pos] for pos in sorted(positions)]
     
     def get_schedule_by_day(self, day: DayOfWeek) -> List[ScheduleEntry]:
         """Get all schedule entries for a specific day."""
-        return [entry for entry in self.schedule if entry.time_slot.day == day]
+        # Buckets are keyed by the plain day string; a DayOfWeek argument
+        # hits the same key through str-enum hashing
+        return list(self._ensure_entry_buckets()[3].get(day, ()))
     
     def get_teacher_schedule(self, teacher_id: str) -> List[ScheduleEntry]:
         """Get schedule entries for a specific teacher."""
-        return [entry for entry in self.schedule if entry.teacher.employee_id == teacher_id]
-    
+        return list(self._ensure_entry_buckets()[0].get(teacher_id, ()))
+
     def get_classroom_schedule(self, room_number: str) -> List[ScheduleEntry]:
         """Get schedule entries for a specific classroom."""
-        return [entry for entry in self.schedule if entry.classroom.room_number == room_number]
-    
+        return list(self._ensure_entry_buckets()[1].get(room_number, ()))
+
     def get_subject_schedule(self, subject_code: str) -> List[ScheduleEntry]:
         """Get schedule entries for a specific subject."""
-        return [entry for entry in self.schedule if entry.subject.code == subject_code]
+        return list(self._ensure_entry_buckets()[2].get(subject_code, ()))
     
+    def compute_all_stats(self) -> Dict[str, any]:
+        """
+        Compute every schedule-wide aggregate in one pass (cached).
+
+        Teacher hours, per-day classroom utilization, per-subject hours and
+        resource conflicts all need the same walk over the schedule; fusing
+        them into a single sweep over the SoA arrays means one trip through
+        memory instead of one per query.  The result is cached and dropped
+        by :meth:`_invalidate_schedule_caches` on any schedule mutation.
+
+        Returns:
+            Dict with ``teacher_hours`` (employee_id -> hours),
+            ``classroom_utilization`` (room_number -> day -> hours),
+            ``subject_hours`` (code -> hours) and ``conflict_pairs``
+            (list of conflicting schedule-index pairs).
+        """
+        if self._stats_cache is not None:
+            return self._stats_cache
+
+        if not self.schedule:
+            self._stats_cache = {
+                "teacher_hours": {},
+                "classroom_utilization": {},
+                "subject_hours": {},
+                "conflict_pairs": [],
+            }
+            return self._stats_cache
+
+        teacher_ids, room_ids, teacher_idx, room_idx, day_idx, start_min, end_min, duration_min = self._entries_soa()
+        day_values = [day.value for day in DayOfWeek]
+
+        teacher_minutes = np.bincount(
+            teacher_idx, weights=duration_min, minlength=len(teacher_ids)
+        )
+        teacher_hours = {
+            teacher_ids[i]: float(teacher_minutes[i]) / 60.0
+            for i in np.nonzero(teacher_minutes)[0]
+        }
+
+        room_minutes = self.utilization_matrix()
+        utilization: Dict[str, Dict[str, float]] = {}
+        for room_i, day_i in zip(*np.nonzero(room_minutes)):
+            room = room_ids[room_i]
+            utilization.setdefault(room, {})[day_values[day_i]] = float(room_minutes[room_i, day_i]) / 60.0
+
+        subject_hours: Dict[str, float] = defaultdict(float)
+        for entry in self.schedule:
+            subject_hours[entry.subject.code] += entry.subject.duration_minutes / 60.0
+
+        # Conflicts: sort by (resource, day, start) per resource axis, then
+        # only same-resource same-day neighbours can overlap in time. This
+        # is the interval sweep specialized to this problem - grouping by
+        # resource first shrinks the active set to at most one interval on
+        # a conflict-free schedule, so no heap is needed; the integer scan
+        # itself lives in the (optionally JIT-compiled) kernel
+        # Conflicts compare the slot intervals, matching conflicts_with
+        # and the incremental index; subject duration only feeds the hour
+        # aggregations above and can differ from the slot length
+        end64 = end_min.astype(np.int64)
+        start64 = start_min.astype(np.int64)
+        day64 = day_idx.astype(np.int64)
+        pairs = set()
+        for resource_idx in (teacher_idx, room_idx):
+            res64 = resource_idx.astype(np.int64)
+            order = np.lexsort((start64, day64, res64))
+            cap = max(16, len(order))
+            while True:
+                out_i = np.empty(cap, dtype=np.int64)
+                out_j = np.empty(cap, dtype=np.int64)
+                count = find_conflict_pairs(
+                    res64, day64, start64, end64, order, out_i, out_j
+                )
+                if count <= cap:
+                    break
+                cap = count
+            pairs.update(zip(out_i[:count].tolist(), out_j[:count].tolist()))
+        conflict_pairs = sorted(pairs)
+
+        self._stats_cache = {
+            "teacher_hours": teacher_hours,
+            "classroom_utilization": utilization,
+            "subject_hours": dict(subject_hours),
+            "conflict_pairs": conflict_pairs,
+        }
+        return self._stats_cache
+
+    def _ensure_minute_accumulators(self) -> None:
+        """
+        Build the per-teacher and per-(room, day) minute accumulators.
+
+        One linear pass on first read after a bulk mutation; afterwards
+        add/remove_schedule_entry keep both maps current in place, so the
+        hours accessors stay O(resources) under polling instead of paying
+        the full stats sweep per mutation.
+        """
+        if self._teacher_minutes is not None and self._room_day_minutes is not None:
+            return
+        teacher_minutes: Dict[str, int] = defaultdict(int)
+        room_day_minutes: Dict[Tuple[str, str], int] = defaultdict(int)
+        for entry in self.schedule:
+            duration = entry.subject.duration_minutes
+            teacher_minutes[entry.teacher.employee_id] += duration
+            room_day_minutes[(entry.classroom.room_number, entry.day)] += duration
+        self._teacher_minutes = dict(teacher_minutes)
+        self._room_day_minutes = dict(room_day_minutes)
+
     def get_weekly_hours_by_teacher(self) -> Dict[str, float]:
         """Get weekly teaching hours for each teacher."""
-        hours = defaultdict(float)
-        for entry in self.schedule:
-            hours[entry.teacher.employee_id] += entry.subject.duration_minutes / 60.0
-        return dict(hours)
-    
+        self._ensure_minute_accumulators()
+        return {
+            teacher_id: minutes / 60.0
+            for teacher_id, minutes in self._teacher_minutes.items()
+            if minutes
+        }
+
     def get_classroom_utilization(self) -> Dict[str, Dict[str, float]]:
         """Get classroom utilization by day."""
-        utilization = defaultdict(lambda: defaultdict(float))
-        for entry in self.schedule:
-            day = entry.time_slot.day.value
-            room = entry.classroom.room_number
-            utilization[room][day] += entry.subject.duration_minutes / 60.0
-        return dict(utilization)
-    
+        self._ensure_minute_accumulators()
+        utilization: Dict[str, Dict[str, float]] = {}
+        for (room, day), minutes in self._room_day_minutes.items():
+            if minutes:
+                utilization.setdefault(room, {})[day] = minutes / 60.0
+        return utilization
+
+    def utilization_matrix(self) -> np.ndarray:
+        """Scheduled minutes as a dense (n_rooms, 7) float array.
+
+        Rows follow the resource index room order and columns follow
+        DayOfWeek order, so vectorized consumers can reduce it directly
+        (row sums for weekly room load, column sums for daily totals)
+        instead of walking the nested utilization dict entry by entry.
+        Built from the cached array view in one scatter-add pass.
+        """
+        _, room_ids, _, room_idx, day_idx, _, _, duration_min = self._entries_soa()
+        matrix = np.zeros((len(room_ids), len(DayOfWeek)), dtype=np.float64)
+        if len(room_idx):
+            np.add.at(matrix, (room_idx, day_idx), duration_min)
+        return matrix
+
     def validate_schedule(self) -> List[str]:
         """Validate the entire schedule and return list of issues."""
+        if self._validation_cache is not None:
+            return list(self._validation_cache)
+
         issues = []
-        
+        stats = self.compute_all_stats()
+
         # Check for conflicts
-        for i, entry1 in enumerate(self.schedule):
-            for entry2 in self.schedule[i+1:]:
-                if entry1.conflicts_with(entry2):
-                    issues.append(f"Conflict between {entry1} and {entry2}")
-        
+        for i, j in stats["conflict_pairs"]:
+            issues.append(f"Conflict between {self.schedule[i]} and {self.schedule[j]}")
+
         # Check if subjects meet their weekly requirements
-        subject_hours = defaultdict(float)
-        for entry in self.schedule:
-            subject_hours[entry.subject.code] += entry.subject.duration_minutes / 60.0
-        
+        subject_hours = stats["subject_hours"]
+
         for subject_code, subject in self.subjects.items():
             required_hours = subject.get_total_hours_per_week()
             actual_hours = subject_hours.get(subject_code, 0)
@@ -229,14 +850,40 @@ class TimeTable(BaseModel):
                 issues.append(
                     f"Teacher {teacher.name} is scheduled for {hours}h but max is {teacher.max_hours_per_week}h"
                 )
-        
-        return issues
+
+        self._validation_cache = issues
+        return list(issues)
     
+    def get_quick_stats(self) -> Dict[str, any]:
+        """
+        Get the cheap subset of statistics in O(1).
+
+        Covers the fields the CLI info panel shows; total minutes and the
+        conflict count come from counters maintained incrementally by
+        add/remove_schedule_entry and are rebuilt once after bulk schedule
+        changes.
+        """
+        if self._cached_total_minutes is None or self._cached_conflict_count is None:
+            self._cached_total_minutes = sum(
+                entry.subject.duration_minutes for entry in self.schedule
+            )
+            self._cached_conflict_count = len(self.compute_all_stats()["conflict_pairs"])
+
+        return {
+            "total_schedule_entries": len(self.schedule),
+            "total_subjects": len(self.subjects),
+            "total_teachers": len(self.teachers),
+            "total_classrooms": len(self.classrooms),
+            "total_teaching_hours": self._cached_total_minutes / 60.0,
+            "schedule_conflicts": self._cached_conflict_count,
+        }
+
     def get_statistics(self) -> Dict[str, any]:
         """Get timetable statistics."""
-        teacher_hours = self.get_weekly_hours_by_teacher()
+        stats = self.compute_all_stats()
+        teacher_hours = stats["teacher_hours"]
         classroom_util = self.get_classroom_utilization()
-        
+
         return {
             "total_schedule_entries": len(self.schedule),
             "total_subjects": len(self.subjects),
@@ -244,13 +891,14 @@ class TimeTable(BaseModel):
             "total_classrooms": len(self.classrooms),
             "average_teacher_hours": sum(teacher_hours.values()) / len(teacher_hours) if teacher_hours else 0,
             "total_teaching_hours": sum(teacher_hours.values()),
-            "schedule_conflicts": len([issue for issue in self.validate_schedule() if "Conflict" in issue]),
+            "schedule_conflicts": len(stats["conflict_pairs"]),
             "classroom_utilization": classroom_util
         }
     
     def clear_schedule(self) -> None:
         """Clear all schedule entries."""
         self.schedule = []
+        self._invalidate_schedule_caches()
     
     def __str__(self) -> str:
         return f"TimeTable: {self.name} ({self.academic_year} - {self.semester})"
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""Optional numba kernel for bulk slot overlap detection.
+
+Backs ``find_overlaps`` for large batches: the pair enumeration over the
+minute-of-week bound arrays is compute-bound and branch-predictable, so
+JIT compilation pays off well before the numpy broadcast matrix becomes
+memory-bound. Without numba the pure-Python sweep in ``time_slot`` is
+used instead - importing this module is always safe.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    # Numba is an optional accelerator - detection works without it
+    njit = None
+    HAS_NUMBA = False
+
+
+def _overlap_pairs(starts, ends):
+    """
+    Indices of all overlapping interval pairs, as an (K, 2) int64 array.
+
+    Inputs are minute-of-week bounds sorted by start; sorting bounds the
+    inner scan to genuinely overlapping neighbours, so the loop is
+    O(N log N + K) like the Python sweep rather than all-pairs. Counting
+    first keeps allocation out of the jitted loop.
+    """
+    n = starts.shape[0]
+    count = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            if starts[j] >= ends[i]:
+                break
+            count += 1
+    out = np.empty((count, 2), dtype=np.int64)
+    k = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            if starts[j] >= ends[i]:
+                break
+            out[k, 0] = i
+            out[k, 1] = j
+            k += 1
+    return out
+
+
+if HAS_NUMBA:
+    # Explicit signature so the one-off compilation happens at import,
+    # not on the first scheduling call; cache=True persists the compiled
+    # kernel across processes
+    overlap_pairs_kernel = njit(
+        'int64[:, :](int32[:], int32[:])', cache=True, nogil=True
+    )(_overlap_pairs)
+else:
+    overlap_pairs_kernel = None
@@ -37,12 +37,35 @@ class BaseModel(PydanticBaseModel, ABC):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary."""
-        return self.dict()
+        # model_dump is the direct serializer entry point; .dict() is the
+        # deprecated wrapper around it and adds a warning-emitting hop
+        return self.model_dump()
+
+    def to_json(self) -> bytes:
+        """Serialize the model to JSON bytes.
+
+        Goes through pydantic's compiled serializer in a single pass, so
+        statistics/export callers get wire-ready bytes without first
+        materializing the intermediate field-by-field Python dict.
+        """
+        return self.model_dump_json().encode("utf-8")
     
     @classmethod
     def from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
         """Create model instance from dictionary."""
         return cls(**data)
+
+    @classmethod
+    def from_trusted_dict(cls: Type[T], data: Dict[str, Any]) -> T:
+        """Create model instance from pre-validated data, skipping validation.
+
+        Bulk loaders that round-trip this application's own output pay the
+        full validator stack per instance even though every value already
+        passed it on the way in. This goes through pydantic's construct
+        fast path instead; callers must supply correctly typed values for
+        every field they pass, as nothing is coerced or checked.
+        """
+        return cls.model_construct(**data)
     
     def __str__(self) -> str:
         """String representation of the model."""
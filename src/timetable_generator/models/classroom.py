@@ -1,12 +1,18 @@
 """Classroom model for timetable scheduling."""
 
+from bisect import bisect_right
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
-from pydantic import Field, validator
+import numpy as np
+from pydantic import Field, PrivateAttr, model_validator, validator
 
 from .base import BaseModel
-from .time_slot import TimeSlot, DayOfWeek
+from .time_slot import DAY_BIT, TimeSlot, DayOfWeek
+
+# Strips the separators allowed in room numbers in one C-level pass, so
+# validation avoids a chain of per-separator string copies on bulk imports
+_ROOM_SEPARATORS = str.maketrans('', '', '-_.')
 
 
 class RoomType(str, Enum):
@@ -28,6 +34,30 @@ class RoomStatus(str, Enum):
     CLOSED = "closed"
 
 
+# Boolean feature fields packed into the classroom feature mask, in bit order
+_FEATURE_FIELDS = (
+    'has_projector', 'has_audio_system', 'has_whiteboard', 'has_blackboard',
+    'has_computers', 'has_internet', 'has_air_conditioning',
+)
+_FEATURE_BIT = {name: i for i, name in enumerate(_FEATURE_FIELDS)}
+
+
+def requirements_mask(requirements: Dict[str, bool]) -> int:
+    """
+    Pack a requirements dict into the feature bitmask encoding.
+
+    Callers matching one subject against many rooms build the mask once
+    and pass it to meets_requirements, reducing each room check to a
+    single AND-compare. Requirements outside the packed feature fields
+    cannot be encoded and raise KeyError - keep those on the dict path.
+    """
+    mask = 0
+    for requirement, needed in requirements.items():
+        if needed:
+            mask |= 1 << _FEATURE_BIT[requirement]
+    return mask
+
+
 class Classroom(BaseModel):
     """Represents a classroom in the timetable system."""
     
@@ -52,7 +82,7 @@ class Classroom(BaseModel):
     has_air_conditioning: bool = Field(default=False, description="Has air conditioning")
     
     # Special equipment
-    special_equipment: List[str] = Field(default_factory=list, description="List of special equipment")
+    special_equipment: Set[str] = Field(default_factory=set, description="Special equipment in the room")
     software_available: List[str] = Field(default_factory=list, description="Available software")
     
     # Availability
@@ -67,11 +97,59 @@ class Classroom(BaseModel):
     # Usage tracking
     utilization_hours: Dict[str, float] = Field(default_factory=dict, description="Daily utilization hours")
     booking_count: int = Field(default=0, description="Number of current bookings")
-    
+
+    # available_days packed as a 7-bit mask, keyed to the set object it was
+    # built from; assignment validation replaces the set, so an identity
+    # mismatch signals the mask is stale
+    _days_mask: int = PrivateAttr(default=0)
+    _days_mask_source: Optional[int] = PrivateAttr(default=None)
+
+    @property
+    def available_days_mask(self) -> int:
+        """available_days as a bitmask (bit i = day i available)."""
+        days = self.available_days
+        if self._days_mask_source != id(days):
+            mask = 0
+            for day in days:
+                mask |= 1 << DAY_BIT[day]
+            self._days_mask = mask
+            self._days_mask_source = id(days)
+        return self._days_mask
+
+    # unavailable_slots and maintenance_slots merged into one sorted,
+    # coalesced interval list per day; same identity-keyed staleness
+    # convention as the day mask above
+    _blackouts_by_day: Optional[Dict[int, List[Tuple[int, int]]]] = PrivateAttr(default=None)
+    _blackouts_source: Optional[Tuple[int, int]] = PrivateAttr(default=None)
+
+    def _ensure_blackouts(self) -> Dict[int, List[Tuple[int, int]]]:
+        """Build the per-day merged blackout interval lists (cached)."""
+        source = (id(self.unavailable_slots), id(self.maintenance_slots))
+        if self._blackouts_by_day is None or self._blackouts_source != source:
+            by_day: Dict[int, List[Tuple[int, int]]] = {}
+            for slot in self.unavailable_slots:
+                by_day.setdefault(slot.day_bit, []).append((slot.start_min, slot.end_min))
+            for slot in self.maintenance_slots:
+                by_day.setdefault(slot.day_bit, []).append((slot.start_min, slot.end_min))
+            for day_bit, intervals in by_day.items():
+                intervals.sort()
+                merged = [intervals[0]]
+                for start, end in intervals[1:]:
+                    if start <= merged[-1][1]:
+                        if end > merged[-1][1]:
+                            merged[-1] = (merged[-1][0], end)
+                    else:
+                        merged.append((start, end))
+                by_day[day_bit] = merged
+            self._blackouts_by_day = by_day
+            self._blackouts_source = source
+        return self._blackouts_by_day
+
+
     @validator('room_number')
     def validate_room_number(cls, v):
         """Validate room number format."""
-        if not v.replace('-', '').replace('_', '').replace('.', '').isalnum():
+        if not v.translate(_ROOM_SEPARATORS).isalnum():
             raise ValueError("Room number must contain only alphanumeric characters, hyphens, underscores, or dots")
         return v.upper()
     
@@ -99,30 +177,69 @@ class Classroom(BaseModel):
                 raise ValueError("Computer count specified but has_computers is False")
         return v
     
+    # status == AVAILABLE resolved to a plain bool whenever validation
+    # runs, mirroring Teacher's active flag
+    _is_open: bool = PrivateAttr(default=True)
+
+    @model_validator(mode='after')
+    def _cache_status_flag(self):
+        """Refresh the bookable flag after (re)validation."""
+        self._is_open = self.status == RoomStatus.AVAILABLE
+        return self
+
     def is_available_at(self, time_slot: TimeSlot) -> bool:
         """Check if classroom is available at a specific time slot."""
-        if self.status != RoomStatus.AVAILABLE:
+        if not self._is_open:
             return False
         
-        if time_slot.day not in self.available_days:
+        if not (self.available_days_mask >> time_slot.day_bit) & 1:
+            return False
+
+        # Check against the merged unavailable/maintenance intervals: the
+        # per-day list is sorted and coalesced, so one bisect plus a
+        # neighbour check decides overlap
+        intervals = self._ensure_blackouts().get(time_slot.day_bit)
+        if not intervals:
+            return True
+        start, end = time_slot.start_min, time_slot.end_min
+        i = bisect_right(intervals, (start, end))
+        if i and intervals[i - 1][1] > start:
+            return False
+        if i < len(intervals) and intervals[i][0] < end:
             return False
-        
-        # Check against unavailable slots
-        for unavailable_slot in self.unavailable_slots:
-            if time_slot.overlaps_with(unavailable_slot):
-                return False
-        
-        # Check against maintenance slots
-        for maintenance_slot in self.maintenance_slots:
-            if time_slot.overlaps_with(maintenance_slot):
-                return False
-        
         return True
     
-    def meets_requirements(self, requirements: Dict[str, bool]) -> bool:
-        """Check if classroom meets specific requirements."""
+    # Boolean features packed into one integer, recomputed whenever
+    # validation runs (including field assignment)
+    _feature_mask: int = PrivateAttr(default=0)
+
+    @model_validator(mode='after')
+    def _pack_feature_mask(self):
+        """Rebuild the feature bitmask after (re)validation."""
+        mask = 0
+        for name, bit in _FEATURE_BIT.items():
+            if getattr(self, name):
+                mask |= 1 << bit
+        self._feature_mask = mask
+        return self
+
+    def meets_requirements(self, requirements) -> bool:
+        """Check if classroom meets specific requirements.
+
+        Accepts either a dict of feature flags or a prebuilt int from
+        requirements_mask; the mask path is one AND plus a compare.
+        """
+        mask = self._feature_mask
+        if isinstance(requirements, int):
+            return (mask & requirements) == requirements
         for requirement, needed in requirements.items():
-            if needed and not getattr(self, requirement, False):
+            if not needed:
+                continue
+            bit = _FEATURE_BIT.get(requirement)
+            if bit is not None:
+                if not (mask >> bit) & 1:
+                    return False
+            elif not getattr(self, requirement, False):
                 return False
         return True
     
@@ -131,13 +248,12 @@ class Classroom(BaseModel):
         return self.capacity >= student_count
     
     def add_equipment(self, equipment: str) -> None:
-        """Add special equipment to the classroom."""
-        if equipment not in self.special_equipment:
-            self.special_equipment.append(equipment)
-    
+        """Add special equipment to the classroom (idempotent)."""
+        self.special_equipment.add(equipment)
+
     def remove_equipment(self, equipment: str) -> None:
-        """Remove special equipment from the classroom."""
-        self.special_equipment = [eq for eq in self.special_equipment if eq != equipment]
+        """Remove special equipment from the classroom, if present."""
+        self.special_equipment.discard(equipment)
     
     def add_software(self, software: str) -> None:
         """Add available software to the classroom."""
@@ -162,6 +278,34 @@ class Classroom(BaseModel):
             parts.append(f"Floor {self.floor}")
         return ", ".join(parts)
     
+    def to_record(self) -> Tuple[int, int, bool, int]:
+        """The numeric scheduling facts of this room, for SoA packing."""
+        return (self.capacity, self._feature_mask, self._is_open,
+                self.available_days_mask)
+
+    def __hash__(self) -> int:
+        """Hash by room number, the natural key used across the timetable."""
+        return hash(self.room_number)
+
     def __str__(self) -> str:
         """String representation of the classroom."""
-        return f"{self.room_number}: {self.name} (Capacity: {self.capacity})"
\ No newline at end of file
+        return f"{self.room_number}: {self.name} (Capacity: {self.capacity})"
+
+
+def classrooms_to_soa(classrooms: List[Classroom]) -> Dict[str, np.ndarray]:
+    """
+    Pack a room list into parallel arrays for vectorized filtering.
+
+    Feasibility scans over many rooms then run as single numpy
+    expressions - e.g. ``(soa['caps'] & req) == req`` with a
+    requirements_mask value, or ``soa['capacity'] >= students`` -
+    instead of a Python method call per room.
+    """
+    n = len(classrooms)
+    records = [room.to_record() for room in classrooms]
+    return {
+        "capacity": np.fromiter((r[0] for r in records), dtype=np.int32, count=n),
+        "caps": np.fromiter((r[1] for r in records), dtype=np.int64, count=n),
+        "open": np.fromiter((r[2] for r in records), dtype=np.bool_, count=n),
+        "days_mask": np.fromiter((r[3] for r in records), dtype=np.int16, count=n),
+    }
\ No newline at end of file
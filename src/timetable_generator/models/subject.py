@@ -1,12 +1,18 @@
 """Subject model for timetable scheduling."""
 
 from enum import Enum
-from typing import List, Optional
+from functools import cached_property
+from sys import intern
+from typing import FrozenSet, List, Optional
 
-from pydantic import Field, validator
+from pydantic import Field, PrivateAttr, model_validator, validator
 
 from .base import BaseModel
 
+# Strips the separators allowed in subject codes in one C-level pass, so
+# validation avoids a chain of per-separator string copies on bulk imports
+_CODE_SEPARATORS = str.maketrans('', '', ' -_')
+
 
 class SubjectType(str, Enum):
     """Types of subjects."""
@@ -47,10 +53,22 @@ class Subject(BaseModel):
     @validator('code')
     def validate_code(cls, v):
         """Validate subject code format."""
-        if not v.replace(' ', '').replace('-', '').replace('_', '').isalnum():
+        if not v.translate(_CODE_SEPARATORS).isalnum():
             raise ValueError("Subject code must contain only alphanumeric characters, spaces, hyphens, or underscores")
-        return v.upper()
+        # Interned so codes used as dict keys across the timetable hash
+        # once and compare by pointer
+        return intern(v.upper())
     
+    @validator('prerequisites')
+    def normalize_prerequisites(cls, v):
+        """Uppercase and intern prerequisite codes once, at validation.
+
+        Lookups then match without re-normalizing the stored side, and
+        the codes share their interned storage with the subject codes
+        they reference.
+        """
+        return [intern(p.upper()) for p in v]
+
     @validator('duration_minutes')
     def validate_duration(cls, v):
         """Validate duration is reasonable."""
@@ -67,14 +85,68 @@ class Subject(BaseModel):
             raise ValueError("Sessions per week cannot exceed 10")
         return v
     
+    @model_validator(mode='after')
+    def _drop_hours_cache(self):
+        """Reset the memoized weekly hours after (re)validation.
+
+        With validate_assignment enabled this also runs on every field
+        assignment, so reassigning duration_minutes or sessions_per_week
+        forces a recompute on next access.
+        """
+        self.__dict__.pop('total_hours_per_week', None)
+        return self
+
+    @cached_property
+    def total_hours_per_week(self) -> float:
+        """Total hours per week, memoized until a field changes."""
+        return (self.duration_minutes * self.sessions_per_week) / 60.0
+
     def get_total_hours_per_week(self) -> float:
         """Calculate total hours per week for this subject."""
-        return (self.duration_minutes * self.sessions_per_week) / 60.0
+        return self.total_hours_per_week
     
+    # prerequisites uppercased and interned into a frozenset for O(1)
+    # lookups; identity-keyed staleness like Teacher's qualification set,
+    # so replacing the list invalidates the cache automatically. Edit the
+    # list through the mutators below (or reassign it wholesale) - the
+    # identity key cannot see in-place mutation
+    _prereq_set: FrozenSet[str] = PrivateAttr(default=frozenset())
+    _prereq_source: Optional[int] = PrivateAttr(default=None)
+
     def has_prerequisite(self, subject_code: str) -> bool:
         """Check if this subject has a specific prerequisite."""
-        return subject_code.upper() in [prereq.upper() for prereq in self.prerequisites]
+        prereqs = self.prerequisites
+        if self._prereq_source != id(prereqs):
+            self._prereq_set = frozenset(intern(p.upper()) for p in prereqs)
+            self._prereq_source = id(prereqs)
+        return subject_code.upper() in self._prereq_set
+
+    def add_prerequisite(self, subject_code: str) -> None:
+        """Add a prerequisite subject code."""
+        if not self.has_prerequisite(subject_code):
+            self.prerequisites.append(intern(subject_code.upper()))
+            self._prereq_source = None
+
+    def remove_prerequisite(self, subject_code: str) -> None:
+        """Remove a prerequisite subject code."""
+        subject_code = subject_code.upper()
+        # The frozenset check skips the list walk entirely on misses
+        if not self.has_prerequisite(subject_code):
+            return
+        try:
+            # Validation stores codes uppercased, so a single in-place
+            # remove usually suffices
+            self.prerequisites.remove(subject_code)
+        except ValueError:
+            # Entries that bypassed validation need the filter
+            self.prerequisites = [p for p in self.prerequisites
+                                  if p.upper() != subject_code]
+        self._prereq_source = None
     
+    def __hash__(self) -> int:
+        """Hash by subject code, the natural key used across the timetable."""
+        return hash(self.code)
+
     def __str__(self) -> str:
         """String representation of the subject."""
         return f"{self.code}: {self.name}"
\ No newline at end of file
@@ -1,12 +1,15 @@
 """Teacher model for timetable scheduling."""
 
+from bisect import bisect_right
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from functools import cached_property
+from sys import intern
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
-from pydantic import Field, validator
+from pydantic import Field, PrivateAttr, model_validator, validator
 
 from .base import BaseModel
-from .time_slot import TimeSlot, DayOfWeek
+from .time_slot import DAY_BIT, TimeSlot, DayOfWeek
 
 
 class TeacherType(str, Enum):
@@ -56,13 +59,34 @@ class Teacher(BaseModel):
     # Workload tracking
     current_weekly_hours: float = Field(default=0.0, description="Current weekly teaching hours")
     assigned_subjects: Dict[str, int] = Field(default_factory=dict, description="Subject code to hours mapping")
-    
+
+    # available_days packed as a 7-bit mask, keyed to the set object it was
+    # built from; assignment validation replaces the set, so an identity
+    # mismatch signals the mask is stale
+    _days_mask: int = PrivateAttr(default=0)
+    _days_mask_source: Optional[int] = PrivateAttr(default=None)
+
+    @property
+    def available_days_mask(self) -> int:
+        """available_days as a bitmask (bit i = day i available)."""
+        days = self.available_days
+        if self._days_mask_source != id(days):
+            mask = 0
+            for day in days:
+                mask |= 1 << DAY_BIT[day]
+            self._days_mask = mask
+            self._days_mask_source = id(days)
+        return self._days_mask
+
+
     @validator('employee_id')
     def validate_employee_id(cls, v):
         """Validate employee ID format."""
         if not v.replace('-', '').replace('_', '').isalnum():
             raise ValueError("Employee ID must contain only alphanumeric characters, hyphens, or underscores")
-        return v.upper()
+        # Interned so the same ID used as a dict key across the timetable
+        # hashes once and compares by pointer
+        return intern(v.upper())
     
     @validator('email')
     def validate_email(cls, v):
@@ -87,45 +111,144 @@ class Teacher(BaseModel):
             raise ValueError("Consecutive hours cannot exceed daily hours")
         return v
     
+    # unavailable_slots as sorted, coalesced intervals per day; identity-
+    # keyed staleness like the day mask above
+    _unavail_by_day: Optional[Dict[int, List[Tuple[int, int]]]] = PrivateAttr(default=None)
+    _unavail_source: Optional[int] = PrivateAttr(default=None)
+
+    def _ensure_unavailable_index(self) -> Dict[int, List[Tuple[int, int]]]:
+        """Build the per-day sorted unavailable interval lists (cached)."""
+        source = id(self.unavailable_slots)
+        if self._unavail_by_day is None or self._unavail_source != source:
+            by_day: Dict[int, List[Tuple[int, int]]] = {}
+            for slot in self.unavailable_slots:
+                by_day.setdefault(slot.day_bit, []).append((slot.start_min, slot.end_min))
+            for day_bit, intervals in by_day.items():
+                intervals.sort()
+                merged = [intervals[0]]
+                for start, end in intervals[1:]:
+                    if start <= merged[-1][1]:
+                        if end > merged[-1][1]:
+                            merged[-1] = (merged[-1][0], end)
+                    else:
+                        merged.append((start, end))
+                by_day[day_bit] = merged
+            self._unavail_by_day = by_day
+            self._unavail_source = source
+        return self._unavail_by_day
+
+    # status == ACTIVE resolved to a plain bool whenever validation runs
+    # (construction and every field assignment), so the hot availability
+    # check branches on a flag instead of comparing enums per call
+    _is_active: bool = PrivateAttr(default=True)
+
+    @model_validator(mode='after')
+    def _cache_status_flag(self):
+        """Refresh the active flag after (re)validation."""
+        self._is_active = self.status == TeacherStatus.ACTIVE
+        return self
+
     def is_available_at(self, time_slot: TimeSlot) -> bool:
         """Check if teacher is available at a specific time slot."""
-        if self.status != TeacherStatus.ACTIVE:
+        if not self._is_active:
+            return False
+
+        if not (self.available_days_mask >> time_slot.day_bit) & 1:
             return False
-        
-        if time_slot.day not in self.available_days:
+
+        # Check against unavailable slots: sorted and coalesced per day,
+        # so one bisect plus a neighbour comparison decides overlap
+        intervals = self._ensure_unavailable_index().get(time_slot.day_bit)
+        if not intervals:
+            return True
+        start, end = time_slot.start_min, time_slot.end_min
+        i = bisect_right(intervals, (start, end))
+        if i and intervals[i - 1][1] > start:
+            return False
+        if i < len(intervals) and intervals[i][0] < end:
             return False
-        
-        # Check against unavailable slots
-        for unavailable_slot in self.unavailable_slots:
-            if time_slot.overlaps_with(unavailable_slot):
-                return False
-        
         return True
     
+    # subjects_qualified uppercased into a frozenset for O(1) lookups;
+    # identity-keyed like the day mask, with the in-place mutators below
+    # resetting the source explicitly. add_subject_qualification dedupes
+    # through the same set, so repeated adds stay O(1) as well
+    _qualified_set: FrozenSet[str] = PrivateAttr(default=frozenset())
+    _qualified_source: Optional[int] = PrivateAttr(default=None)
+
     def can_teach_subject(self, subject_code: str) -> bool:
         """Check if teacher is qualified to teach a subject."""
-        return subject_code.upper() in [s.upper() for s in self.subjects_qualified]
-    
+        quals = self.subjects_qualified
+        if self._qualified_source != id(quals):
+            self._qualified_set = frozenset(s.upper() for s in quals)
+            self._qualified_source = id(quals)
+        return subject_code.upper() in self._qualified_set
+
     def add_subject_qualification(self, subject_code: str) -> None:
         """Add a subject qualification."""
         if not self.can_teach_subject(subject_code):
-            self.subjects_qualified.append(subject_code.upper())
-    
+            self.subjects_qualified.append(intern(subject_code.upper()))
+            self._qualified_source = None
+
     def remove_subject_qualification(self, subject_code: str) -> None:
         """Remove a subject qualification."""
-        self.subjects_qualified = [s for s in self.subjects_qualified 
-                                 if s.upper() != subject_code.upper()]
+        subject_code = subject_code.upper()
+        # The frozenset check skips the list walk entirely on misses
+        if not self.can_teach_subject(subject_code):
+            return
+        try:
+            # Codes added through add_subject_qualification are stored
+            # uppercased, so a single in-place remove usually suffices
+            self.subjects_qualified.remove(subject_code)
+        except ValueError:
+            # Mixed-case entries supplied at construction need the filter
+            self.subjects_qualified = [s for s in self.subjects_qualified
+                                       if s.upper() != subject_code]
+        self._qualified_source = None
     
     def assign_hours(self, subject_code: str, hours: float) -> None:
         """Assign teaching hours for a subject."""
-        subject_code = subject_code.upper()
-        if subject_code in self.assigned_subjects:
-            self.assigned_subjects[subject_code] += hours
-        else:
-            self.assigned_subjects[subject_code] = hours
-        
+        subject_code = intern(subject_code.upper())
+        # One get plus one store instead of a membership probe followed by
+        # a second lookup on the hit path
+        current = self.assigned_subjects.get(subject_code)
+        self.assigned_subjects[subject_code] = (
+            current + hours if current is not None else hours
+        )
+
+        # The total moves by exactly the assigned delta - no need to re-sum
+        # every subject on each assignment
+        self.current_weekly_hours += hours
+
+    def recompute_weekly_hours(self) -> None:
+        """Re-derive current_weekly_hours from assigned_subjects.
+
+        For callers that mutate assigned_subjects directly instead of
+        going through assign_hours.
+        """
         self.current_weekly_hours = sum(self.assigned_subjects.values())
     
+    @model_validator(mode='after')
+    def _drop_scale_cache(self):
+        """Invalidate the cached percentage scale after (re)validation.
+
+        Runs on construction and on every field assignment, so the cached
+        value can never outlive a max_hours_per_week change.
+        """
+        self.__dict__.pop('percentage_scale', None)
+        return self
+
+    @cached_property
+    def percentage_scale(self) -> float:
+        """Multiplier turning weekly hours into a workload percentage.
+
+        hours * percentage_scale == hours / max_hours_per_week * 100, with
+        the division and zero guard paid once instead of per report row.
+        """
+        if self.max_hours_per_week > 0:
+            return 100.0 / self.max_hours_per_week
+        return 0.0
+
     def get_available_hours(self) -> float:
         """Get remaining available hours for the week."""
         return max(0, self.max_hours_per_week - self.current_weekly_hours)
@@ -134,6 +257,10 @@ class Teacher(BaseModel):
         """Get current workload as percentage of maximum."""
         return (self.current_weekly_hours / self.max_hours_per_week) * 100
     
+    def __hash__(self) -> int:
+        """Hash by employee ID, the natural key used across the timetable."""
+        return hash(self.employee_id)
+
     def __str__(self) -> str:
         """String representation of the teacher."""
         return f"{self.name} ({self.employee_id})"
\ No newline at end of file
@@ -1,12 +1,18 @@
 """Time slot model for timetable scheduling."""
 
-from datetime import time, timedelta
+from datetime import time
 from enum import Enum
-from typing import Optional
+from typing import ClassVar, Dict, List, Optional, Tuple
 
-from pydantic import Field, validator
+import numpy as np
+from pydantic import Field, PrivateAttr, model_validator
 
 from .base import BaseModel
+from ._overlap_numba import overlap_pairs_kernel
+
+# Batches at least this large go through the jitted pair kernel when
+# numba is available; below it the Python sweep wins on setup cost
+_KERNEL_THRESHOLD = 256
 
 
 class DayOfWeek(str, Enum):
@@ -20,6 +26,18 @@ class DayOfWeek(str, Enum):
     SUNDAY = "Sunday"
 
 
+# Bit position per day for availability bitmasks, keyed by both the enum
+# member and its string value so lookups work for either representation
+# the use_enum_values config leaves in model fields
+DAY_BIT: Dict[object, int] = {}
+for _i, _day in enumerate(DayOfWeek):
+    DAY_BIT[_day] = _i
+    DAY_BIT[_day.value] = _i
+
+# Display name per day bit, the inverse of DAY_BIT for rendering
+_DAY_NAMES = [day.value for day in DayOfWeek]
+
+
 class TimeSlot(BaseModel):
     """Represents a time slot in the timetable."""
     
@@ -28,41 +46,198 @@ class TimeSlot(BaseModel):
     end_time: time = Field(..., description="End time of the slot")
     duration_minutes: Optional[int] = Field(None, description="Duration in minutes")
     break_time: bool = Field(default=False, description="Whether this is a break time")
-    
-    @validator('duration_minutes', always=True)
-    def calculate_duration(cls, v, values):
-        """Calculate duration if not provided."""
-        if v is None and 'start_time' in values and 'end_time' in values:
-            start = values['start_time']
-            end = values['end_time']
-            duration = timedelta(
-                hours=end.hour - start.hour,
-                minutes=end.minute - start.minute
+
+    # Shared pool of canonical instances, keyed by (day, start, end); see intern()
+    _pool: ClassVar[Dict[Tuple, 'TimeSlot']] = {}
+
+    # Interval bounds as minute-of-day integers, resolved once at
+    # construction so overlap checks are integer comparisons
+    _start_min: int = PrivateAttr(default=0)
+    _end_min: int = PrivateAttr(default=0)
+
+    # Bit position of this slot's day, for testing availability bitmasks
+    _day_bit: int = PrivateAttr(default=0)
+
+    # Minute-of-week interval bounds (day_bit * 1440 + minute-of-day).
+    # Slots never span midnight, so intervals on different days cannot
+    # overlap numerically and the half-open comparison below needs no
+    # separate day check
+    _start_mow: int = PrivateAttr(default=0)
+    _end_mow: int = PrivateAttr(default=0)
+
+    # HH:MM display strings rendered once, so formatters don't re-run
+    # strftime per slot per render
+    _hhmm_start: str = PrivateAttr(default="")
+    _hhmm_end: str = PrivateAttr(default="")
+
+    # Full display string, also rendered once; exporters call str() per
+    # cell per render
+    _str: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context) -> None:
+        self._start_min = self.start_time.hour * 60 + self.start_time.minute
+        self._end_min = self.end_time.hour * 60 + self.end_time.minute
+        self._day_bit = DAY_BIT[self.day]
+        self._start_mow = self._day_bit * 1440 + self._start_min
+        self._end_mow = self._day_bit * 1440 + self._end_min
+        self._hhmm_start = f"{self.start_time.hour:02d}:{self.start_time.minute:02d}"
+        self._hhmm_end = f"{self.end_time.hour:02d}:{self.end_time.minute:02d}"
+        self._str = f"{_DAY_NAMES[self._day_bit]} {self._hhmm_start}-{self._hhmm_end}"
+
+    @property
+    def start_min(self) -> int:
+        """Start of the slot in minutes from midnight."""
+        return self._start_min
+
+    @property
+    def end_min(self) -> int:
+        """End of the slot in minutes from midnight."""
+        return self._end_min
+
+    @property
+    def day_bit(self) -> int:
+        """Bit position of this slot's day in day bitmasks."""
+        return self._day_bit
+
+    @property
+    def hhmm_start(self) -> str:
+        """Start time as a pre-rendered HH:MM string."""
+        return self._hhmm_start
+
+    @property
+    def hhmm_end(self) -> str:
+        """End time as a pre-rendered HH:MM string."""
+        return self._hhmm_end
+
+    @classmethod
+    def trusted(cls, day: DayOfWeek, start_time: time, end_time: time,
+                duration_minutes: Optional[int] = None,
+                break_time: bool = False) -> 'TimeSlot':
+        """
+        Build a slot from pre-validated values, skipping the validators.
+
+        Scheduler loops construct the same well-formed slots over and over;
+        this computes the duration inline and goes through the construct
+        fast path, so none of the field validators run. Callers must
+        guarantee end_time > start_time - nothing is checked here.
+        """
+        if duration_minutes is None:
+            duration_minutes = (
+                (end_time.hour - start_time.hour) * 60
+                + (end_time.minute - start_time.minute)
             )
-            return int(duration.total_seconds() / 60)
-        return v
-    
-    @validator('end_time')
-    def validate_end_time(cls, v, values):
-        """Validate that end time is after start time."""
-        if 'start_time' in values and v <= values['start_time']:
+        return cls.model_construct(
+            day=day, start_time=start_time, end_time=end_time,
+            duration_minutes=duration_minutes, break_time=break_time,
+        )
+
+    @classmethod
+    def intern(cls, day: DayOfWeek, start_time: time, end_time: time) -> 'TimeSlot':
+        """
+        Return the canonical pooled instance for (day, start_time, end_time).
+
+        The scheduler generates the same weekly slots over and over; pooling
+        keeps one object per distinct triple so comparisons in hot loops can
+        short-circuit on identity and no validation is re-run for repeats.
+        Pooled slots are shared - callers must treat them as immutable.
+        """
+        key = (day, start_time, end_time)
+        slot = cls._pool.get(key)
+        if slot is None:
+            # Pool inputs come from the scheduler's own grid generation,
+            # so the validator-skipping path is safe here
+            slot = cls._pool.setdefault(
+                key, cls.trusted(day, start_time, end_time)
+            )
+        return slot
+
+    @model_validator(mode='after')
+    def _check_times_and_duration(self):
+        """Validate the time range and fill in the duration in one pass.
+
+        Replaces the per-field v1 validators: one model-level pass avoids
+        the values-dict plumbing and the timedelta round trip per slot.
+        """
+        if self.end_time <= self.start_time:
             raise ValueError("End time must be after start time")
-        return v
+        if self.duration_minutes is None:
+            # Assignment triggers revalidation; the field is non-None on
+            # that second pass, so this does not recurse further
+            self.duration_minutes = (
+                (self.end_time.hour - self.start_time.hour) * 60
+                + (self.end_time.minute - self.start_time.minute)
+            )
+        return self
     
     def overlaps_with(self, other: 'TimeSlot') -> bool:
-        """Check if this time slot overlaps with another."""
-        if self.day != other.day:
-            return False
-        
-        return not (self.end_time <= other.start_time or self.start_time >= other.end_time)
-    
+        """Check if this time slot overlaps with another.
+
+        Pure integer comparisons on minute-of-week bounds; ends sit
+        strictly inside their day, so slots on different days can never
+        satisfy the half-open interval test and no day check is needed.
+        """
+        return self._start_mow < other._end_mow and other._start_mow < self._end_mow
+
     def is_adjacent_to(self, other: 'TimeSlot') -> bool:
-        """Check if this time slot is adjacent to another."""
-        if self.day != other.day:
-            return False
-        
-        return self.end_time == other.start_time or self.start_time == other.end_time
+        """Check if this time slot is adjacent to another.
+
+        Minute-of-week ends never reach the next day's origin, so the
+        equality can only hold for same-day slots.
+        """
+        return self._end_mow == other._start_mow or self._start_mow == other._end_mow
     
+    def __hash__(self) -> int:
+        """Hash by (day, start, end); DAY_BIT keeps both day representations equal."""
+        return hash((DAY_BIT[self.day], self.start_time, self.end_time))
+
     def __str__(self) -> str:
-        """String representation of the time slot."""
-        return f"{self.day.value} {self.start_time.strftime('%H:%M')}-{self.end_time.strftime('%H:%M')}"
\ No newline at end of file
+        """Pre-rendered string representation of the time slot.
+
+        Looking the day name up by bit also repairs str() for slots whose
+        day field holds the plain string that use_enum_values leaves
+        behind, where the old day.value access raised.
+        """
+        return self._str
+
+
+def overlaps_matrix(slots: List[TimeSlot]) -> np.ndarray:
+    """
+    Pairwise overlap matrix for a batch of slots.
+
+    One broadcast over the cached minute-of-week bounds replaces N^2
+    scalar overlaps_with calls; M[i, j] is True when slots[i] overlaps
+    slots[j]. The minute-of-week encoding already separates days, so no
+    day comparison is needed (see TimeSlot.overlaps_with).
+    """
+    n = len(slots)
+    starts = np.fromiter((s._start_mow for s in slots), dtype=np.int32, count=n)
+    ends = np.fromiter((s._end_mow for s in slots), dtype=np.int32, count=n)
+    return (starts[:, None] < ends[None, :]) & (starts[None, :] < ends[:, None])
+
+
+def find_overlaps(slots: List[TimeSlot]) -> List[Tuple[TimeSlot, TimeSlot]]:
+    """
+    All overlapping slot pairs via sort-then-sweep.
+
+    Sorting by minute-of-week start and sweeping with an active window is
+    O(N log N + K) for K overlaps, against the N^2 of the all-pairs
+    matrix - and it allocates nothing quadratic, so it stays viable where
+    even overlaps_matrix would be memory-bound. The week-wide ordering
+    flushes each day's window naturally: a new day's start lies past
+    every earlier day's end, so no per-day bucketing is required.
+    """
+    ordered = sorted(slots, key=lambda s: s._start_mow)
+
+    if overlap_pairs_kernel is not None and len(ordered) >= _KERNEL_THRESHOLD:
+        n = len(ordered)
+        starts = np.fromiter((s._start_mow for s in ordered), dtype=np.int32, count=n)
+        ends = np.fromiter((s._end_mow for s in ordered), dtype=np.int32, count=n)
+        return [(ordered[i], ordered[j]) for i, j in overlap_pairs_kernel(starts, ends)]
+
+    out: List[Tuple[TimeSlot, TimeSlot]] = []
+    active: List[TimeSlot] = []
+    for slot in ordered:
+        active = [a for a in active if a._end_mow > slot._start_mow]
+        out.extend((a, slot) for a in active)
+        active.append(slot)
+    return out
\ No newline at end of file
@@ -1,11 +1,24 @@
 """Formatting utilities for timetable display and export."""
 
+import io
 from datetime import datetime
+from heapq import nlargest
+from itertools import groupby
 from typing import Dict, List, Any, Optional
 from collections import defaultdict
 
 from ..core.timetable import TimeTable, ScheduleEntry
-from ..models.time_slot import DayOfWeek
+from ..models.time_slot import DAY_BIT, DayOfWeek
+
+# Per-row templates cached at module level so the render loops only pay
+# for substitution, not template parsing
+_SCHEDULE_ROW = "{time} - {subject} ({teacher})\n"
+_WORKLOAD_ROW = "{status} {name} ({eid})\n   Hours: {hours:.1f}h / {max}h ({pct:.1f}%)\n"
+
+# Canonical day ordinal for sort keys; DAY_BIT accepts both the enum
+# member and its string value, covering either representation on entries
+_DAY_ORDER = DAY_BIT
+_DAY_NAMES = [day.value for day in DayOfWeek]
 
 
 def format_timetable(timetable: TimeTable, format_type: str = "grid") -> str:
@@ -34,29 +47,31 @@ def _format_timetable_grid(timetable: TimeTable) -> str:
     if not timetable.schedule:
         return "No schedule entries found."
     
-    # Group entries by day and time
-    day_schedule = defaultdict(list)
-    for entry in timetable.schedule:
-        day_schedule[entry.time_slot.day].append(entry)
-    
-    # Sort entries by time within each day
-    for day in day_schedule:
-        day_schedule[day].sort(key=lambda e: e.time_slot.start_time)
-    
-    output = []
-    output.append(f"=== {timetable.name} ===")
-    output.append(f"Academic Year: {timetable.academic_year}, Semester: {timetable.semester}")
-    output.append("")
-    
-    for day in timetable.working_days:
-        if day in day_schedule:
-            output.append(f"--- {day.value} ---")
-            for entry in day_schedule[day]:
-                time_str = f"{entry.time_slot.start_time.strftime('%H:%M')}-{entry.time_slot.end_time.strftime('%H:%M')}"
-                output.append(f"{time_str:10} | {entry.subject.name:20} | {entry.teacher.name:15} | {entry.classroom.name}")
-            output.append("")
-    
-    return "\n".join(output)
+    # One global sort by (day, start), then a linear groupby walk per day
+    # instead of bucketing into a dict and sorting each bucket separately
+    working = {_DAY_ORDER[day] for day in timetable.working_days}
+    sorted_entries = sorted(
+        (e for e in timetable.schedule if _DAY_ORDER[e.day] in working),
+        key=lambda e: (_DAY_ORDER[e.day], e.start_min)
+    )
+
+    buf = io.StringIO()
+    write = buf.write
+    write(f"=== {timetable.name} ===\n")
+    write(f"Academic Year: {timetable.academic_year}, Semester: {timetable.semester}\n\n")
+
+    for day_ord, entries in groupby(sorted_entries, key=lambda e: _DAY_ORDER[e.day]):
+        write(f"--- {_DAY_NAMES[day_ord]} ---\n")
+        for entry in entries:
+            time_str = f"{entry.time_slot.hhmm_start}-{entry.time_slot.hhmm_end}"
+            # str.ljust pads in C without re-parsing a format spec per row
+            write(time_str.ljust(10) + " | " + entry.subject.name.ljust(20)
+                  + " | " + entry.teacher.name.ljust(15) + " | "
+                  + entry.classroom.name + "\n")
+        write("\n")
+
+    # Every line carries its own newline; drop the last one to match join()
+    return buf.getvalue()[:-1]
 
 
 def _format_timetable_list(timetable: TimeTable) -> str:
@@ -64,28 +79,28 @@ def _format_timetable_list(timetable: TimeTable) -> str:
     if not timetable.schedule:
         return "No schedule entries found."
     
-    output = []
-    output.append(f"=== {timetable.name} ===")
-    output.append(f"Total Entries: {len(timetable.schedule)}")
-    output.append("")
-    
+    buf = io.StringIO()
+    write = buf.write
+    write(f"=== {timetable.name} ===\n")
+    write(f"Total Entries: {len(timetable.schedule)}\n\n")
+
     # Sort by day and time
     sorted_entries = sorted(
         timetable.schedule,
-        key=lambda e: (list(DayOfWeek).index(e.time_slot.day), e.time_slot.start_time)
+        key=lambda e: (_DAY_ORDER[e.day], e.start_min)
     )
-    
+
     for i, entry in enumerate(sorted_entries, 1):
-        output.append(f"{i:3}. {entry}")
-        output.append(f"     Teacher: {entry.teacher.name} ({entry.teacher.employee_id})")
-        output.append(f"     Classroom: {entry.classroom.name} (Capacity: {entry.classroom.capacity})")
+        write(f"{i:3}. {entry}\n")
+        write(f"     Teacher: {entry.teacher.name} ({entry.teacher.employee_id})\n")
+        write(f"     Classroom: {entry.classroom.name} (Capacity: {entry.classroom.capacity})\n")
         if entry.student_count:
-            output.append(f"     Students: {entry.student_count}")
+            write(f"     Students: {entry.student_count}\n")
         if entry.notes:
-            output.append(f"     Notes: {entry.notes}")
-        output.append("")
-    
-    return "\n".join(output)
+            write(f"     Notes: {entry.notes}\n")
+        write("\n")
+
+    return buf.getvalue()[:-1]
 
 
 def _format_timetable_summary(timetable: TimeTable) -> str:
@@ -93,39 +108,38 @@ def _format_timetable_summary(timetable: TimeTable) -> str:
     stats = timetable.get_statistics()
     teacher_hours = timetable.get_weekly_hours_by_teacher()
     
-    output = []
-    output.append(f"=== {timetable.name} Summary ===")
-    output.append(f"Academic Year: {timetable.academic_year}, Semester: {timetable.semester}")
-    output.append("")
-    
-    output.append("📊 Statistics:")
-    output.append(f"  • Total Schedule Entries: {stats['total_schedule_entries']}")
-    output.append(f"  • Total Subjects: {stats['total_subjects']}")
-    output.append(f"  • Total Teachers: {stats['total_teachers']}")
-    output.append(f"  • Total Classrooms: {stats['total_classrooms']}")
-    output.append(f"  • Total Teaching Hours: {stats['total_teaching_hours']:.1f}")
-    output.append(f"  • Average Teacher Hours: {stats['average_teacher_hours']:.1f}")
-    output.append(f"  • Schedule Conflicts: {stats['schedule_conflicts']}")
-    output.append("")
-    
+    buf = io.StringIO()
+    write = buf.write
+    write(f"=== {timetable.name} Summary ===\n")
+    write(f"Academic Year: {timetable.academic_year}, Semester: {timetable.semester}\n\n")
+
+    write("📊 Statistics:\n")
+    write(f"  • Total Schedule Entries: {stats['total_schedule_entries']}\n")
+    write(f"  • Total Subjects: {stats['total_subjects']}\n")
+    write(f"  • Total Teachers: {stats['total_teachers']}\n")
+    write(f"  • Total Classrooms: {stats['total_classrooms']}\n")
+    write(f"  • Total Teaching Hours: {stats['total_teaching_hours']:.1f}\n")
+    write(f"  • Average Teacher Hours: {stats['average_teacher_hours']:.1f}\n")
+    write(f"  • Schedule Conflicts: {stats['schedule_conflicts']}\n\n")
+
     if teacher_hours:
-        output.append("👨‍🏫 Teacher Workload:")
+        write("👨‍🏫 Teacher Workload:\n")
         for teacher_id, hours in sorted(teacher_hours.items()):
             teacher = timetable.teachers[teacher_id]
-            percentage = (hours / teacher.max_hours_per_week * 100) if teacher.max_hours_per_week > 0 else 0
-            output.append(f"  • {teacher.name}: {hours:.1f}h ({percentage:.1f}%)")
-        output.append("")
-    
+            percentage = hours * teacher.percentage_scale
+            write(f"  • {teacher.name}: {hours:.1f}h ({percentage:.1f}%)\n")
+        write("\n")
+
     # Show validation issues if any
     issues = timetable.validate_schedule()
     if issues:
-        output.append("⚠️  Issues Found:")
+        write("⚠️  Issues Found:\n")
         for issue in issues:
-            output.append(f"  • {issue}")
-    else:
-        output.append("✅ No issues found in schedule")
-    
-    return "\n".join(output)
+            write(f"  • {issue}\n")
+        return buf.getvalue()[:-1]
+
+    write("✅ No issues found in schedule")
+    return buf.getvalue()
 
 
 def format_schedule(entries: List[ScheduleEntry], title: str = "Schedule") -> str:
@@ -142,29 +156,26 @@ def format_schedule(entries: List[ScheduleEntry], title: str = "Schedule") -> st
     if not entries:
         return f"=== {title} ===\nNo entries found."
     
-    output = []
-    output.append(f"=== {title} ===")
-    output.append(f"Total Entries: {len(entries)}")
-    output.append("")
-    
-    # Group by day
-    day_entries = defaultdict(list)
-    for entry in entries:
-        day_entries[entry.time_slot.day].append(entry)
-    
-    # Sort entries within each day
-    for day in day_entries:
-        day_entries[day].sort(key=lambda e: e.time_slot.start_time)
-    
-    for day in DayOfWeek:
-        if day in day_entries:
-            output.append(f"--- {day.value} ---")
-            for entry in day_entries[day]:
-                time_str = f"{entry.time_slot.start_time.strftime('%H:%M')}-{entry.time_slot.end_time.strftime('%H:%M')}"
-                output.append(f"{time_str} - {entry.subject.name} ({entry.teacher.name})")
-            output.append("")
-    
-    return "\n".join(output)
+    buf = io.StringIO()
+    write = buf.write
+    write(f"=== {title} ===\n")
+    write(f"Total Entries: {len(entries)}\n\n")
+
+    # Same single-sort groupby walk as the grid format
+    sorted_entries = sorted(entries, key=lambda e: (_DAY_ORDER[e.day], e.start_min))
+
+    for day_ord, day_group in groupby(sorted_entries, key=lambda e: _DAY_ORDER[e.day]):
+        write(f"--- {_DAY_NAMES[day_ord]} ---\n")
+        for entry in day_group:
+            time_str = f"{entry.time_slot.hhmm_start}-{entry.time_slot.hhmm_end}"
+            write(_SCHEDULE_ROW.format(
+                time=time_str,
+                subject=entry.subject.name,
+                teacher=entry.teacher.name,
+            ))
+        write("\n")
+
+    return buf.getvalue()[:-1]
 
 
 def format_teacher_schedule(timetable: TimeTable, teacher_id: str) -> str:
@@ -205,7 +216,7 @@ def format_subject_schedule(timetable: TimeTable, subject_code: str) -> str:
 
 def format_time_slot(time_slot) -> str:
     """Format a time slot for display."""
-    return f"{time_slot.day.value} {time_slot.start_time.strftime('%H:%M')}-{time_slot.end_time.strftime('%H:%M')}"
+    return f"{time_slot.day.value} {time_slot.hhmm_start}-{time_slot.hhmm_end}"
 
 
 def format_duration(minutes: int) -> str:
@@ -223,86 +234,115 @@ def format_duration(minutes: int) -> str:
 
 def format_utilization_report(timetable: TimeTable) -> str:
     """Format classroom utilization report."""
-    utilization = timetable.get_classroom_utilization()
-    
-    if not utilization:
+    # All the percentage math runs vectorized over the dense room-by-day
+    # matrix; the Python loop below only renders text for occupied cells
+    hours = timetable.utilization_matrix() / 60.0
+    totals = hours.sum(axis=1)
+    daily_rates = hours / 8 * 100
+    max_possible = len(timetable.working_days) * 8  # Assuming 8-hour workday
+    rates = (totals / max_possible * 100) if max_possible > 0 else totals * 0
+
+    if not totals.any():
         return "No utilization data available."
-    
+
     output = []
     output.append("=== Classroom Utilization Report ===")
     output.append("")
-    
-    for room_number, daily_hours in utilization.items():
+
+    # Matrix rows follow the resource index, which preserves the
+    # classrooms dict order
+    for row, room_number in enumerate(timetable.classrooms):
+        if not totals[row]:
+            continue
         classroom = timetable.classrooms[room_number]
         output.append(f"🏫 {classroom.name} ({room_number})")
-        
-        total_hours = sum(daily_hours.values())
-        max_possible = len(timetable.working_days) * 8  # Assuming 8-hour workday
-        utilization_rate = (total_hours / max_possible * 100) if max_possible > 0 else 0
-        
-        output.append(f"   Total Hours: {total_hours:.1f}h")
-        output.append(f"   Utilization: {utilization_rate:.1f}%")
-        
-        for day, hours in daily_hours.items():
-            daily_rate = (hours / 8 * 100) if hours > 0 else 0
-            output.append(f"   {day}: {hours:.1f}h ({daily_rate:.1f}%)")
+        output.append(f"   Total Hours: {totals[row]:.1f}h")
+        output.append(f"   Utilization: {rates[row]:.1f}%")
+
+        for col, day_hours in enumerate(hours[row]):
+            if day_hours:
+                output.append(
+                    f"   {_DAY_NAMES[col]}: {day_hours:.1f}h ({daily_rates[row, col]:.1f}%)")
         output.append("")
-    
+
     return "\n".join(output)
 
 
 def format_conflicts_report(timetable: TimeTable) -> str:
     """Format conflicts report."""
-    issues = timetable.validate_schedule()
-    conflicts = [issue for issue in issues if "Conflict" in issue]
-    
-    if not conflicts:
+    # Read the conflict pairs straight off the fused stats sweep instead
+    # of rendering every validation issue and filtering the strings; only
+    # the actually conflicting entries get formatted
+    pairs = timetable.compute_all_stats()["conflict_pairs"]
+
+    if not pairs:
         return "✅ No conflicts found in the schedule."
-    
+
     output = []
     output.append("⚠️  Schedule Conflicts Report")
     output.append("=" * 40)
     output.append("")
-    
-    for i, conflict in enumerate(conflicts, 1):
-        output.append(f"{i}. {conflict}")
-    
+
+    schedule = timetable.schedule
+    for n, (i, j) in enumerate(pairs, 1):
+        output.append(f"{n}. Conflict between {schedule[i]} and {schedule[j]}")
+
     output.append("")
-    output.append(f"Total conflicts found: {len(conflicts)}")
-    
+    output.append(f"Total conflicts found: {len(pairs)}")
+
     return "\n".join(output)
 
 
-def format_workload_report(timetable: TimeTable) -> str:
-    """Format teacher workload report."""
+def format_workload_report(timetable: TimeTable, top: Optional[int] = None) -> str:
+    """Format teacher workload report.
+
+    Args:
+        timetable: TimeTable instance to report on
+        top: When given, only the top N teachers by hours are listed,
+            selected with a partial sort instead of ordering everyone
+
+    Returns:
+        Formatted workload report string
+    """
     teacher_hours = timetable.get_weekly_hours_by_teacher()
-    
+
     if not teacher_hours:
         return "No workload data available."
-    
-    output = []
-    output.append("=== Teacher Workload Report ===")
-    output.append("")
-    
-    # Sort teachers by workload (descending)
-    sorted_teachers = sorted(
-        teacher_hours.items(),
-        key=lambda x: x[1],
-        reverse=True
-    )
-    
+
+    buf = io.StringIO()
+    write = buf.write
+    write("=== Teacher Workload Report ===\n\n")
+
+    # Sort teachers by workload (descending); nlargest is O(N log K) when
+    # only the top K are wanted
+    if top is not None:
+        sorted_teachers = nlargest(top, teacher_hours.items(), key=lambda x: x[1])
+    else:
+        sorted_teachers = sorted(
+            teacher_hours.items(),
+            key=lambda x: x[1],
+            reverse=True
+        )
+
     for teacher_id, hours in sorted_teachers:
         teacher = timetable.teachers[teacher_id]
-        percentage = (hours / teacher.max_hours_per_week * 100) if teacher.max_hours_per_week > 0 else 0
-        
-        status = "🟢" if percentage <= 100 else "🔴"
-        output.append(f"{status} {teacher.name} ({teacher.employee_id})")
-        output.append(f"   Hours: {hours:.1f}h / {teacher.max_hours_per_week}h ({percentage:.1f}%)")
-        
+        # One multiplication per row; the guard and division live in the
+        # cached percentage_scale
+        percentage = hours * teacher.percentage_scale
+
+        write(_WORKLOAD_ROW.format_map({
+            'status': "🟢" if percentage <= 100 else "🔴",
+            'name': teacher.name,
+            'eid': teacher.employee_id,
+            'hours': hours,
+            'max': teacher.max_hours_per_week,
+            'pct': percentage,
+        }))
+
         if percentage > 100:
             overload = hours - teacher.max_hours_per_week
-            output.append(f"   ⚠️  Overloaded by {overload:.1f}h")
-        
-        output.append("")
-    
-    return "\n".join(output)
\ No newline at end of file
+            write(f"   ⚠️  Overloaded by {overload:.1f}h\n")
+
+        write("\n")
+
+    return buf.getvalue()[:-1]
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""Benchmarks for the model hot kernels.
+
+Run with pytest-benchmark installed; the whole module is skipped when
+the plugin is absent so the unit suite stays dependency-free. Fixtures
+do the setup, benchmark(...) times only the kernel under test.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from datetime import time
+
+import numpy as np
+
+from timetable_generator.models.classroom import (
+    Classroom, classrooms_to_soa, requirements_mask
+)
+from timetable_generator.models.time_slot import (
+    TimeSlot, DayOfWeek, find_overlaps, overlaps_matrix
+)
+
+_DAYS = list(DayOfWeek)
+
+
+@pytest.fixture(params=[100, 1000, 10000])
+def slot_batch(request):
+    """Deterministic slot batches; trusted() skips validation in setup."""
+    rng = np.random.default_rng(0)
+    n = request.param
+    days = rng.integers(0, 7, size=n)
+    starts = rng.integers(8 * 60, 17 * 60, size=n)
+    durations = rng.choice([30, 60, 90], size=n)
+    batch = []
+    for i in range(n):
+        start_h, start_m = divmod(int(starts[i]), 60)
+        end_h, end_m = divmod(int(starts[i] + durations[i]), 60)
+        batch.append(TimeSlot.trusted(
+            _DAYS[days[i]], time(start_h, start_m), time(end_h, end_m)
+        ))
+    return batch
+
+
+@pytest.fixture(params=[100, 1000])
+def room_batch(request):
+    """Rooms with mixed feature sets for the requirements filters."""
+    rng = np.random.default_rng(0)
+    n = request.param
+    flags = rng.integers(0, 2, size=(n, 2), dtype=bool)
+    return [
+        Classroom(name=f"R{i}", room_number=f"R{i:04d}",
+                  capacity=int(20 + 10 * (i % 5)),
+                  has_projector=bool(flags[i, 0]),
+                  has_computers=bool(flags[i, 1]))
+        for i in range(n)
+    ]
+
+
+def test_benchmark_overlaps_matrix(benchmark, slot_batch):
+    if len(slot_batch) > 1000:
+        pytest.skip("quadratic matrix too large at this size")
+    benchmark(overlaps_matrix, slot_batch)
+
+
+def test_benchmark_find_overlaps(benchmark, slot_batch):
+    benchmark(find_overlaps, slot_batch)
+
+
+def test_benchmark_meets_requirements_scalar(benchmark, room_batch):
+    requirements = {'has_projector': True, 'has_computers': True}
+
+    def run():
+        return [room.meets_requirements(requirements) for room in room_batch]
+
+    benchmark(run)
+
+
+def test_benchmark_meets_requirements_soa(benchmark, room_batch):
+    req = requirements_mask({'has_projector': True, 'has_computers': True})
+    soa = classrooms_to_soa(room_batch)
+
+    def run():
+        return (soa["caps"] & req) == req
+
+    benchmark(run)
@@ -0,0 +1,156 @@
+"""Shared model fixtures for unit tests.
+
+Module-scoped so read-only tests reuse one validated instance instead of
+paying the full Pydantic construction cost per test. Tests that mutate a
+model build their own instance inside the test body.
+"""
+
+import random
+
+import numpy as np
+import pytest
+from datetime import time
+from timetable_generator.models.subject import Subject
+from timetable_generator.models.teacher import Teacher
+from timetable_generator.models.classroom import Classroom
+from timetable_generator.models.time_slot import TimeSlot, DayOfWeek
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup_validators():
+    """Compile every model's validators before the first timed test.
+
+    Pydantic builds its core schema lazily on first instantiation;
+    paying that once up front keeps the first real test - and any
+    profiling run over the suite - at steady-state cost.
+    """
+    for model in (Subject, Teacher, Classroom, TimeSlot):
+        model.model_rebuild()
+    TimeSlot(day=DayOfWeek.MONDAY, start_time=time(0, 0), end_time=time(0, 1))
+    Subject(name="warmup", code="WARM000", duration_minutes=60)
+    Teacher(name="warmup", employee_id="WARM000")
+    Classroom(name="warmup", room_number="WARM000", capacity=1)
+
+
+@pytest.fixture(scope="module")
+def math_subject():
+    """A plain lecture subject for read-only assertions."""
+    return Subject(
+        name="Mathematics",
+        code="MATH101",
+        duration_minutes=60,
+        sessions_per_week=3
+    )
+
+
+@pytest.fixture(scope="module")
+def default_teacher():
+    """A full-time active teacher qualified for two subjects."""
+    return Teacher(
+        name="Dr. John Smith",
+        employee_id="T001",
+        email="john.smith@university.edu",
+        subjects_qualified=["MATH101", "MATH201"]
+    )
+
+
+@pytest.fixture(scope="module")
+def default_classroom():
+    """A standard classroom with a projector."""
+    return Classroom(
+        name="Main Lecture Hall",
+        room_number="A101",
+        capacity=50,
+        has_projector=True
+    )
+
+
+@pytest.fixture(scope="module")
+def monday_9_10_slot():
+    """A one-hour Monday morning slot."""
+    return TimeSlot(
+        day=DayOfWeek.MONDAY,
+        start_time=time(9, 0),
+        end_time=time(10, 0)
+    )
+
+
+@pytest.fixture(scope="module")
+def slots():
+    """Named slots for the overlap/adjacency parameter tables.
+
+    Built once per module; the parametrized tests reference them by key
+    so each slot is validated a single time instead of per test case.
+    """
+    def _slot(day, start_h, start_m, end_h, end_m):
+        return TimeSlot(day=day, start_time=time(start_h, start_m),
+                        end_time=time(end_h, end_m))
+
+    return {
+        "mon_9_10": _slot(DayOfWeek.MONDAY, 9, 0, 10, 0),
+        "mon_9_30_10_30": _slot(DayOfWeek.MONDAY, 9, 30, 10, 30),
+        "tue_9_10": _slot(DayOfWeek.TUESDAY, 9, 0, 10, 0),
+        "mon_10_11": _slot(DayOfWeek.MONDAY, 10, 0, 11, 0),
+        "mon_11_12": _slot(DayOfWeek.MONDAY, 11, 0, 12, 0),
+    }
+
+
+@pytest.fixture(scope="module")
+def rng():
+    """Seeded generator shared by the randomized payload fixtures."""
+    return random.Random(0)
+
+
+@pytest.fixture(scope="module")
+def sample_models(rng):
+    """One randomized payload of every model kind, built once per module.
+
+    Tests needing a mixed population draw from here instead of
+    regenerating throwaway instances; the shared rng keeps the payload
+    deterministic.
+    """
+    days = list(DayOfWeek)
+    slots = []
+    for _ in range(40):
+        day = rng.choice(days)
+        start = rng.randrange(8 * 60, 17 * 60, 30)
+        end = start + rng.choice((30, 60, 90))
+        slots.append(TimeSlot(day=day, start_time=time(*divmod(start, 60)),
+                              end_time=time(*divmod(end, 60))))
+    subjects = [
+        Subject(name=f"Subject {i}", code=f"SMP{i:03d}", duration_minutes=60,
+                sessions_per_week=rng.randint(1, 4))
+        for i in range(8)
+    ]
+    teachers = [
+        Teacher(name=f"Teacher {i}", employee_id=f"ST{i:03d}",
+                subjects_qualified=[s.code for s in rng.sample(subjects, 2)])
+        for i in range(5)
+    ]
+    classrooms = [
+        Classroom(name=f"Room {i}", room_number=f"SR{i:03d}",
+                  capacity=rng.randrange(20, 60, 10),
+                  has_projector=rng.random() < 0.5,
+                  has_computers=rng.random() < 0.3)
+        for i in range(6)
+    ]
+    return {"subjects": subjects, "teachers": teachers,
+            "classrooms": classrooms, "slots": slots}
+
+
+@pytest.fixture(params=[10, 100, 1000])
+def subject_batch(request):
+    """Deterministic subject batches at increasing sizes.
+
+    Seeded so every run constructs identical models; the random draws
+    are materialized in one vectorized pass up front and the same test
+    body scales across the three sizes.
+    """
+    rng = np.random.default_rng(0)
+    n = request.param
+    sessions = rng.integers(1, 5, size=n)
+    return [
+        Subject(name=f"S{i}", code=f"SUB{i:03d}", duration_minutes=60,
+                sessions_per_week=int(sessions[i]))
+        for i in range(n)
+    ]
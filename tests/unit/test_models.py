@@ -4,48 +4,108 @@ import pytest
 from datetime import time, datetime
 from timetable_generator.models.subject import Subject, SubjectType, SubjectPriority
 from timetable_generator.models.teacher import Teacher, TeacherType, TeacherStatus
-from timetable_generator.models.classroom import Classroom, RoomType, RoomStatus
-from timetable_generator.models.time_slot import TimeSlot, DayOfWeek
+from timetable_generator.models.classroom import (
+    Classroom, RoomType, RoomStatus, classrooms_to_soa, requirements_mask
+)
+from timetable_generator.models.time_slot import (
+    TimeSlot, DayOfWeek, find_overlaps, overlaps_matrix
+)
+
+
+@pytest.mark.parametrize("cls,kwargs,field,expected", [
+    (Subject, {"name": "Physics", "code": "phys101", "duration_minutes": 60},
+     "code", "PHYS101"),
+    (Teacher, {"name": "Jane Doe", "employee_id": "t002"},
+     "employee_id", "T002"),
+    (Classroom, {"name": "Lab", "room_number": "b202", "capacity": 25},
+     "room_number", "B202"),
+])
+def test_identifier_uppercase_conversion(cls, kwargs, field, expected):
+    """Test that identifier fields are converted to uppercase."""
+    assert getattr(cls(**kwargs), field) == expected
+
+
+@pytest.mark.parametrize("cls,kwargs", [
+    # Duration too short
+    (Subject, {"name": "Chemistry", "code": "CHEM101", "duration_minutes": 10}),
+    # End before start
+    (TimeSlot, {"day": DayOfWeek.WEDNESDAY,
+                "start_time": time(10, 0), "end_time": time(9, 0)}),
+])
+def test_invalid_construction_rejected(cls, kwargs):
+    """Test that out-of-range constructor arguments are rejected."""
+    with pytest.raises(ValueError):
+        cls(**kwargs)
+
+
+def test_models_hashable(math_subject, default_teacher, default_classroom,
+                         monday_9_10_slot):
+    """Test that models hash by their natural keys."""
+    assert hash(math_subject) == hash("MATH101")
+    assert hash(default_teacher) == hash("T001")
+    assert hash(default_classroom) == hash("A101")
+    assert len({monday_9_10_slot, monday_9_10_slot}) == 1
+    assert math_subject in {math_subject}
+
+
+def test_schedule_entry_uses_slots(math_subject, default_teacher,
+                                   default_classroom, monday_9_10_slot):
+    """Test the schedule record stays slotted (no per-instance dict).
+
+    The schedule list holds thousands of entries; a __dict__ creeping
+    back in would roughly double their footprint and slow every conflict
+    check's attribute reads.
+    """
+    from timetable_generator.core.timetable import ScheduleEntry
+
+    entry = ScheduleEntry(
+        time_slot=monday_9_10_slot,
+        subject=math_subject,
+        teacher=default_teacher,
+        classroom=default_classroom
+    )
+    assert not hasattr(entry, '__dict__')
+    assert entry.start_min == 540
+
+
+def test_sample_models_consistency(sample_models):
+    """Cross-check the bulk helpers over the shared randomized payload."""
+    slots = sample_models["slots"]
+    matrix = overlaps_matrix(slots)
+    pairs = find_overlaps(slots)
+    # Diagonal is all self-overlaps; every off-diagonal hit appears twice
+    assert int(matrix.sum()) == len(slots) + 2 * len(pairs)
+
+    soa = classrooms_to_soa(sample_models["classrooms"])
+    assert len(soa["capacity"]) == len(sample_models["classrooms"])
+
+    for teacher in sample_models["teachers"]:
+        assert all(teacher.can_teach_subject(code)
+                   for code in teacher.subjects_qualified)
+
+
+def test_subject_batch_construction(subject_batch):
+    """Test batch-generated subjects are valid at every size."""
+    codes = {subject.code for subject in subject_batch}
+    assert len(codes) == len(subject_batch)
+    assert all(1 <= subject.sessions_per_week <= 4 for subject in subject_batch)
+    assert all(subject.get_total_hours_per_week() > 0 for subject in subject_batch)
 
 
 class TestSubject:
     """Test Subject model."""
-    
-    def test_create_subject(self):
+
+    def test_create_subject(self, math_subject):
         """Test creating a subject."""
-        subject = Subject(
-            name="Mathematics",
-            code="MATH101",
-            duration_minutes=60,
-            sessions_per_week=3
-        )
-        
+        subject = math_subject
+
         assert subject.name == "Mathematics"
         assert subject.code == "MATH101"
         assert subject.duration_minutes == 60
         assert subject.sessions_per_week == 3
         assert subject.subject_type == SubjectType.LECTURE
         assert subject.priority == SubjectPriority.MEDIUM
-    
-    def test_subject_code_uppercase_conversion(self):
-        """Test that subject code is converted to uppercase."""
-        subject = Subject(
-            name="Physics",
-            code="phys101",
-            duration_minutes=60
-        )
-        
-        assert subject.code == "PHYS101"
-    
-    def test_invalid_duration(self):
-        """Test validation of invalid duration."""
-        with pytest.raises(ValueError):
-            Subject(
-                name="Chemistry",
-                code="CHEM101",
-                duration_minutes=10  # Too short
-            )
-    
+
     def test_get_total_hours_per_week(self):
         """Test calculation of total hours per week."""
         subject = Subject(
@@ -56,6 +116,8 @@ class TestSubject:
         )
         
         assert subject.get_total_hours_per_week() == 3.0
+        # cached_property memoizes: repeated reads return the same object
+        assert subject.total_hours_per_week is subject.total_hours_per_week
     
     def test_has_prerequisite(self):
         """Test prerequisite checking."""
@@ -63,53 +125,51 @@ class TestSubject:
             name="Advanced Math",
             code="MATH201",
             duration_minutes=60,
-            prerequisites=["MATH101", "MATH102"]
+            prerequisites=["MATH101", "math102"]
         )
-        
+
+        # Codes are normalized to uppercase at validation
+        assert subject.prerequisites == ["MATH101", "MATH102"]
+
         assert subject.has_prerequisite("MATH101")
         assert subject.has_prerequisite("math101")  # Case insensitive
+        assert subject.has_prerequisite("MATH102")
         assert not subject.has_prerequisite("PHYS101")
 
+        # The mutators keep the cached lookup set fresh after the first
+        # has_prerequisite call has built it
+        subject.add_prerequisite("phy101")
+        assert subject.prerequisites == ["MATH101", "MATH102", "PHY101"]
+        assert subject.has_prerequisite("PHY101")
+        subject.add_prerequisite("PHY101")  # Duplicate add is a no-op
+        assert subject.prerequisites == ["MATH101", "MATH102", "PHY101"]
+
+        subject.remove_prerequisite("math102")
+        assert subject.prerequisites == ["MATH101", "PHY101"]
+        assert not subject.has_prerequisite("MATH102")
+        subject.remove_prerequisite("MATH102")  # Absent remove is a no-op
+        assert subject.prerequisites == ["MATH101", "PHY101"]
+
 
 class TestTeacher:
     """Test Teacher model."""
     
-    def test_create_teacher(self):
+    def test_create_teacher(self, default_teacher):
         """Test creating a teacher."""
-        teacher = Teacher(
-            name="Dr. John Smith",
-            employee_id="T001",
-            email="john.smith@university.edu",
-            subjects_qualified=["MATH101", "MATH201"]
-        )
-        
+        teacher = default_teacher
+
         assert teacher.name == "Dr. John Smith"
         assert teacher.employee_id == "T001"
         assert teacher.email == "john.smith@university.edu"
         assert teacher.teacher_type == TeacherType.FULL_TIME
         assert teacher.status == TeacherStatus.ACTIVE
         assert "MATH101" in teacher.subjects_qualified
-    
-    def test_employee_id_uppercase_conversion(self):
-        """Test that employee ID is converted to uppercase."""
-        teacher = Teacher(
-            name="Jane Doe",
-            employee_id="t002"
-        )
-        
-        assert teacher.employee_id == "T002"
-    
-    def test_can_teach_subject(self):
+
+    def test_can_teach_subject(self, default_teacher):
         """Test subject teaching capability check."""
-        teacher = Teacher(
-            name="Dr. Smith",
-            employee_id="T001",
-            subjects_qualified=["MATH101", "PHYS101"]
-        )
-        
-        assert teacher.can_teach_subject("MATH101")
-        assert teacher.can_teach_subject("math101")  # Case insensitive
-        assert not teacher.can_teach_subject("CHEM101")
+        assert default_teacher.can_teach_subject("MATH101")
+        assert default_teacher.can_teach_subject("math101")  # Case insensitive
+        assert not default_teacher.can_teach_subject("CHEM101")
     
     def test_add_subject_qualification(self):
         """Test adding subject qualification."""
@@ -145,15 +205,10 @@ class TestTeacher:
 class TestClassroom:
     """Test Classroom model."""
     
-    def test_create_classroom(self):
+    def test_create_classroom(self, default_classroom):
         """Test creating a classroom."""
-        classroom = Classroom(
-            name="Main Lecture Hall",
-            room_number="A101",
-            capacity=50,
-            has_projector=True
-        )
-        
+        classroom = default_classroom
+
         assert classroom.name == "Main Lecture Hall"
         assert classroom.room_number == "A101"
         assert classroom.capacity == 50
@@ -161,16 +216,6 @@ class TestClassroom:
         assert classroom.room_type == RoomType.CLASSROOM
         assert classroom.status == RoomStatus.AVAILABLE
     
-    def test_room_number_uppercase_conversion(self):
-        """Test that room number is converted to uppercase."""
-        classroom = Classroom(
-            name="Lab",
-            room_number="b202",
-            capacity=25
-        )
-        
-        assert classroom.room_number == "B202"
-    
     def test_can_accommodate(self):
         """Test student capacity check."""
         classroom = Classroom(
@@ -198,9 +243,11 @@ class TestClassroom:
             'has_projector': True
         }
         assert classroom.meets_requirements(requirements)
-        
+        assert classroom.meets_requirements(requirements_mask(requirements))
+
         requirements['has_audio_system'] = True
         assert not classroom.meets_requirements(requirements)
+        assert not classroom.meets_requirements(requirements_mask(requirements))
     
     def test_add_remove_equipment(self):
         """Test adding and removing equipment."""
@@ -212,22 +259,44 @@ class TestClassroom:
         
         classroom.add_equipment("3D Printer")
         assert "3D Printer" in classroom.special_equipment
-        
+
+        # Double-add is idempotent
+        classroom.add_equipment("3D Printer")
+        assert len(classroom.special_equipment) == 1
+
         classroom.remove_equipment("3D Printer")
         assert "3D Printer" not in classroom.special_equipment
 
+        # Removing again is a no-op, not an error
+        classroom.remove_equipment("3D Printer")
+
+    def test_classroom_soa_roundtrip(self):
+        """Test SoA packing agrees with the per-room scalar checks."""
+        rooms = [
+            Classroom(name="Hall", room_number="A101", capacity=50,
+                      has_projector=True),
+            Classroom(name="Lab", room_number="B202", capacity=25,
+                      has_computers=True, has_projector=True),
+            Classroom(name="Closed", room_number="C303", capacity=30,
+                      status=RoomStatus.MAINTENANCE),
+        ]
+        requirements = {'has_projector': True}
+        req = requirements_mask(requirements)
+
+        soa = classrooms_to_soa(rooms)
+        mask = (soa["caps"] & req) == req
+        assert mask.tolist() == [r.meets_requirements(requirements) for r in rooms]
+        assert soa["capacity"].tolist() == [r.capacity for r in rooms]
+        assert soa["open"].tolist() == [True, True, False]
+
 
 class TestTimeSlot:
     """Test TimeSlot model."""
     
-    def test_create_time_slot(self):
+    def test_create_time_slot(self, monday_9_10_slot):
         """Test creating a time slot."""
-        slot = TimeSlot(
-            day=DayOfWeek.MONDAY,
-            start_time=time(9, 0),
-            end_time=time(10, 0)
-        )
-        
+        slot = monday_9_10_slot
+
         assert slot.day == DayOfWeek.MONDAY
         assert slot.start_time == time(9, 0)
         assert slot.end_time == time(10, 0)
@@ -240,71 +309,95 @@ class TestTimeSlot:
             start_time=time(14, 0),
             end_time=time(15, 30)
         )
-        
+
         assert slot.duration_minutes == 90
-    
-    def test_invalid_time_range(self):
-        """Test validation of invalid time range."""
-        with pytest.raises(ValueError):
-            TimeSlot(
-                day=DayOfWeek.WEDNESDAY,
-                start_time=time(10, 0),
-                end_time=time(9, 0)  # End before start
-            )
-    
-    def test_overlaps_with(self):
-        """Test time slot overlap detection."""
-        slot1 = TimeSlot(
-            day=DayOfWeek.MONDAY,
-            start_time=time(9, 0),
-            end_time=time(10, 0)
-        )
-        
-        slot2 = TimeSlot(
-            day=DayOfWeek.MONDAY,
-            start_time=time(9, 30),
-            end_time=time(10, 30)
-        )
-        
-        slot3 = TimeSlot(
-            day=DayOfWeek.TUESDAY,
-            start_time=time(9, 0),
-            end_time=time(10, 0)
-        )
-        
-        slot4 = TimeSlot(
+
+    def test_duration_computed_without_datetime(self):
+        """Test duration uses integer arithmetic, not datetime math.
+
+        Guards against a regression to the datetime.combine/timedelta
+        formulation, which allocates two datetimes per constructed slot.
+        """
+        import timetable_generator.models.time_slot as time_slot_module
+        assert not hasattr(time_slot_module, 'datetime')
+
+        slot = TimeSlot(
             day=DayOfWeek.MONDAY,
-            start_time=time(10, 0),
-            end_time=time(11, 0)
+            start_time=time(14, 45),
+            end_time=time(16, 5)
         )
-        
-        assert slot1.overlaps_with(slot2)  # Same day, overlapping time
-        assert not slot1.overlaps_with(slot3)  # Different day
-        assert not slot1.overlaps_with(slot4)  # Adjacent, not overlapping
+        assert slot.duration_minutes == 80
     
-    def test_is_adjacent_to(self):
+    def test_overlaps_with(self, slots):
+        """Test time slot overlap detection.
+
+        One collection item looping the case table; parametrize costs a
+        test item and fixture resolution per row, which adds up for
+        tables of cheap assertions.
+        """
+        cases = [
+            ("mon_9_10", "mon_9_30_10_30", True),   # Same day, overlapping
+            ("mon_9_30_10_30", "mon_9_10", True),   # Symmetric
+            ("mon_9_10", "tue_9_10", False),        # Different day
+            ("mon_9_10", "mon_10_11", False),       # Adjacent, not overlapping
+            ("mon_9_10", "mon_11_12", False),       # Disjoint
+            ("mon_9_10", "mon_9_10", True),         # Identical interval
+        ]
+        for a, b, expected in cases:
+            assert slots[a].overlaps_with(slots[b]) is expected, (a, b)
+
+    def test_is_adjacent_to(self, slots):
         """Test time slot adjacency detection."""
-        slot1 = TimeSlot(
-            day=DayOfWeek.MONDAY,
-            start_time=time(9, 0),
-            end_time=time(10, 0)
-        )
-        
-        slot2 = TimeSlot(
-            day=DayOfWeek.MONDAY,
-            start_time=time(10, 0),
-            end_time=time(11, 0)
-        )
-        
-        slot3 = TimeSlot(
-            day=DayOfWeek.MONDAY,
-            start_time=time(11, 0),
-            end_time=time(12, 0)
-        )
-        
-        assert slot1.is_adjacent_to(slot2)
-        assert slot2.is_adjacent_to(slot3)
-        assert not slot1.is_adjacent_to(slot3)
+        cases = [
+            ("mon_9_10", "mon_10_11", True),
+            ("mon_10_11", "mon_9_10", True),        # Symmetric
+            ("mon_10_11", "mon_11_12", True),
+            ("mon_9_10", "mon_11_12", False),
+            ("mon_9_10", "tue_9_10", False),        # Different day
+        ]
+        for a, b, expected in cases:
+            assert slots[a].is_adjacent_to(slots[b]) is expected, (a, b)
+
+    def test_overlaps_matrix_matches_scalar(self, slots):
+        """Test batch overlap detection agrees with pairwise checks."""
+        batch = list(slots.values())
+        matrix = overlaps_matrix(batch)
+        for i, a in enumerate(batch):
+            for j, b in enumerate(batch):
+                assert matrix[i, j] == a.overlaps_with(b)
+
+    def test_numba_kernel_matches_python(self, slots):
+        """Test the jitted pair kernel agrees with the Python sweep."""
+        pytest.importorskip("numba")
+        import numpy as np
+        from timetable_generator.models._overlap_numba import overlap_pairs_kernel
+
+        ordered = sorted(slots.values(), key=lambda s: s.start_min
+                         + s.day_bit * 1440)
+        starts = np.array([s.day_bit * 1440 + s.start_min for s in ordered],
+                          dtype=np.int32)
+        ends = np.array([s.day_bit * 1440 + s.end_min for s in ordered],
+                        dtype=np.int32)
+        pairs = {(int(i), int(j)) for i, j in overlap_pairs_kernel(starts, ends)}
+        expected = {
+            (i, j)
+            for i, a in enumerate(ordered)
+            for j, b in enumerate(ordered)
+            if i < j and a.overlaps_with(b)
+        }
+        assert pairs == expected
+
+    def test_find_overlaps_equivalence(self, slots):
+        """Test the sweep finds exactly the pairwise-overlapping pairs."""
+        batch = list(slots.values())
+        found = {frozenset((id(a), id(b))) for a, b in find_overlaps(batch)}
+        expected = {
+            frozenset((id(a), id(b)))
+            for i, a in enumerate(batch)
+            for b in batch[i + 1:]
+            if a.overlaps_with(b)
+        }
+        assert found == expected and found  # fixture contains one overlap
     
     def test_string_representation(self):
         """Test string representation of time slot."""
@@ -315,4 +408,6 @@ class TestTimeSlot:
         )
         
         expected = "Friday 14:30-16:00"
-        assert str(slot) == expected
\ No newline at end of file
+        assert str(slot) == expected
+        # Rendered once at construction; repeat calls return the cache
+        assert str(slot) is str(slot)
\ No newline at end of file